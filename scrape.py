@@ -3,19 +3,21 @@
 Scrape concert events from multiple venues and save to JSON.
 """
 
-import json
 import time
 import traceback
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from scraper import config
 from scraper import spotify_enrichment
 from scraper.pipeline.io import (
-    trim_log_by_time,
+    append_run_log,
     load_existing_events,
     load_seen_cache,
     save_seen_cache,
     load_existing_status,
+    write_json,
 )
 from scraper.pipeline.merge import merge_events, update_first_seen, prune_seen_cache
 from scraper.pipeline.metrics import VenueMetrics
@@ -23,18 +25,26 @@ from scraper.pipeline.r2 import upload_to_r2
 from scraper.pipeline.validate import validate_event
 from scraper.registry import get_scrapers
 from scraper.tm import load_artist_cache, save_artist_cache, enrich_events_with_tm
+from scraper.venues.aeg import save_aeg_cache
 from scraper.utils.events import generate_slug, normalize_price
 
 
 def main():
     all_events = []
-    run_timestamp = datetime.utcnow().isoformat() + "Z"
+    run_timestamp = datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
     log_lines = []  # Collect log entries
+    log_second = None
+    log_timestamp = ""
 
     def log(message, level="INFO"):
         """Log a message to both console and log buffer."""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}"
+        nonlocal log_second, log_timestamp
+        # Timestamps have second precision, so only reformat when the second changes
+        now = int(time.time())
+        if now != log_second:
+            log_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now))
+            log_second = now
+        log_entry = f"[{log_timestamp}] [{level}] {message}"
         print(message)
         log_lines.append(log_entry)
 
@@ -47,8 +57,8 @@ def main():
 
     scrapers = get_scrapers()
 
-    for venue_name, scraper in scrapers.items():
-        log(f"Scraping {venue_name}...")
+    def run_scraper(venue_name, scraper):
+        """Run one venue scraper; returns (events, status, metrics, error_trace)."""
         metrics = VenueMetrics(name=venue_name)
         start_time = time.time()
 
@@ -70,13 +80,12 @@ def main():
             event_count = len(events)
             metrics.event_count = event_count
             metrics.duration_ms = (time.time() - start_time) * 1000
-            log(f"  Found {event_count} events")
-            all_events.extend(events)
 
             venue_status["success"] = True
             venue_status["event_count"] = event_count
             venue_status["last_success"] = run_timestamp
             venue_status["last_success_count"] = event_count
+            return events, venue_status, metrics, None
 
         except Exception as e:
             error_msg = str(e)
@@ -84,15 +93,35 @@ def main():
             metrics.errors = 1
             metrics.error_messages.append(error_msg)
             metrics.duration_ms = (time.time() - start_time) * 1000
-            log(f"  ERROR: Failed to scrape {venue_name}: {error_msg}", "ERROR")
-            log(f"  Traceback:\n{error_trace}", "ERROR")
 
             venue_status["success"] = False
             venue_status["error"] = error_msg
             venue_status["error_trace"] = error_trace
+            return [], venue_status, metrics, error_trace
+
+    # Venues are independent, so scrape them concurrently. Results are collected
+    # in registry order to keep event order (and slug suffixes) deterministic.
+    log(f"Scraping {len(scrapers)} venues ({config.SCRAPE_MAX_WORKERS} workers)...")
+    with ThreadPoolExecutor(max_workers=config.SCRAPE_MAX_WORKERS) as executor:
+        futures = {
+            venue_name: executor.submit(run_scraper, venue_name, scraper)
+            for venue_name, scraper in scrapers.items()
+        }
+
+        for venue_name, future in futures.items():
+            events, venue_status, metrics, error_trace = future.result()
+            log(f"Scraping {venue_name}...")
+            if venue_status["success"]:
+                log(f"  Found {metrics.event_count} events")
+                all_events.extend(events)
+            else:
+                log(f"  ERROR: Failed to scrape {venue_name}: {venue_status['error']}", "ERROR")
+                log(f"  Traceback:\n{error_trace}", "ERROR")
 
-        venue_statuses[venue_name] = venue_status
-        venue_metrics[venue_name] = metrics
+            venue_statuses[venue_name] = venue_status
+            venue_metrics[venue_name] = metrics
+
+    save_aeg_cache()
 
     # Enrich events with TM artist classifications (for non-TM venues)
     if config.TM_API_KEY:
@@ -101,33 +130,30 @@ def main():
         all_events = enrich_events_with_tm(all_events)
         save_artist_cache()
 
-    # Normalize prices, generate slugs, and validate events
+    # Normalize prices, generate slugs, validate, and stamp events in one pass.
+    # Slugs are assigned before validation so duplicate suffixes match prior runs.
+    # Old events from R2 keep their old last_seen (enables stale event detection).
     log("\nProcessing events...")
-    all_events = [normalize_price(e) for e in all_events]
-
-    # Generate slugs for each event, ensuring uniqueness
-    slug_counts = {}
+    slug_counts = defaultdict(int)
+    valid_events = []
     for event in all_events:
+        event = normalize_price(event)
         base_slug = generate_slug(event)
 
         # Handle duplicate slugs by appending a counter
-        if base_slug in slug_counts:
-            slug_counts[base_slug] += 1
-            event["slug"] = f"{base_slug}-{slug_counts[base_slug]}"
-        else:
-            slug_counts[base_slug] = 0
-            event["slug"] = base_slug
-
-    valid_events = [e for e in all_events if validate_event(e)]
-    invalid_count = len(all_events) - len(valid_events)
+        duplicate_index = slug_counts[base_slug]
+        slug_counts[base_slug] = duplicate_index + 1
+        event["slug"] = f"{base_slug}-{duplicate_index}" if duplicate_index else base_slug
 
-    if invalid_count > 0:
-        log(f"  Filtered out {invalid_count} invalid events", "WARNING")
+        if not validate_event(event):
+            continue
 
-    # Set last_seen timestamp on newly scraped events (before merge)
-    # Old events from R2 will keep their old last_seen (enables stale event detection)
-    for event in valid_events:
         event["last_seen"] = run_timestamp
+        valid_events.append(event)
+
+    invalid_count = len(all_events) - len(valid_events)
+    if invalid_count > 0:
+        log(f"  Filtered out {invalid_count} invalid events", "WARNING")
 
     # Load existing events from R2 and merge with new events
     log("\nMerging with existing events from R2...")
@@ -138,7 +164,7 @@ def main():
 
     # Update first_seen field for tracking new events
     seen_cache = load_seen_cache()
-    merged_events, new_event_count = update_first_seen(merged_events, seen_cache)
+    merged_events, new_event_count = update_first_seen(merged_events, seen_cache, now_iso=run_timestamp)
     log(f"  {new_event_count} newly discovered events")
 
     # Enrich events with Spotify links (after merge to preserve existing links)
@@ -150,10 +176,7 @@ def main():
     )
     spotify_enrichment.save_spotify_cache()
 
-    # Sort by date
-    merged_events.sort(key=lambda x: x["date"])
-
-    # Use merged_events as our final list
+    # Use merged_events (already date-ordered by merge_events) as our final list
     valid_events = merged_events
 
     # Determine overall status
@@ -188,12 +211,11 @@ def main():
     config.EVENTS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Save all events (past and future - no more archive separation)
-    with open(config.OUTPUT_PATH, "w") as f:
-        json.dump(valid_events, f, indent=2)
+    write_json(config.OUTPUT_PATH, valid_events)
     log(f"Events saved to {config.OUTPUT_PATH}")
 
     # Prune and save seen cache
-    current_slugs = {e.get("slug") for e in valid_events if e.get("slug")}
+    current_slugs = set(filter(None, (e.get("slug") for e in valid_events)))
     seen_cache = prune_seen_cache(seen_cache, current_slugs)
     save_seen_cache(seen_cache)
     log(f"Seen cache saved ({len(seen_cache['events'])} events tracked)")
@@ -207,8 +229,7 @@ def main():
         "venues": venue_statuses,
     }
 
-    with open(config.STATUS_PATH, "w") as f:
-        json.dump(status_data, f, indent=2)
+    write_json(config.STATUS_PATH, status_data)
     log(f"Status saved to {config.STATUS_PATH}")
 
     # Upload to R2 (Cloudflare object storage)
@@ -218,14 +239,8 @@ def main():
     else:
         log("R2 upload failed or skipped - files only saved locally", "WARNING")
 
-    # Save log file (time-based retention: 14 days)
-    existing_log = trim_log_by_time(config.LOG_PATH, retention_days=14)
-
-    # Add separator and new log entries
-    log_content = existing_log + ["\n--- New Run ---\n"] + [line + "\n" for line in log_lines]
-
-    with open(config.LOG_PATH, "w") as f:
-        f.writelines(log_content)
+    # Save log file (append; trimmed to 14 days once old entries or size require it)
+    append_run_log(config.LOG_PATH, log_lines, retention_days=14)
     log(f"Log saved to {config.LOG_PATH}")
 
 
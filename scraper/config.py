@@ -9,11 +9,16 @@ EVENTS_DIR = REPO_ROOT / "atl-gigs" / "public" / "events"
 OUTPUT_PATH = EVENTS_DIR / "events.json"
 STATUS_PATH = EVENTS_DIR / "scrape-status.json"
 LOG_PATH = EVENTS_DIR / "scrape-log.txt"
+LOG_COMPACT_BYTES = 5 * 1024 * 1024
 SEEN_CACHE_PATH = EVENTS_DIR / "seen-cache.json"
 ARTIST_CACHE_PATH = EVENTS_DIR / "artist-cache.json"
 SPOTIFY_CACHE_PATH = EVENTS_DIR / "artist-spotify-cache.json"
+AEG_CACHE_PATH = EVENTS_DIR / "aeg-cache.json"
+HTTP_CACHE_PATH = EVENTS_DIR / "http-cache.sqlite"
 
 NEW_EVENT_DAYS = 5
+SCRAPE_MAX_WORKERS = int(os.environ.get("SCRAPE_MAX_WORKERS", "16"))
+HTTP_CACHE_SECONDS = int(os.environ.get("HTTP_CACHE_SECONDS", "0"))
 
 R2_ACCOUNT_ID = os.environ.get("R2_ACCOUNT_ID")
 R2_ACCESS_KEY_ID = os.environ.get("R2_ACCESS_KEY_ID")
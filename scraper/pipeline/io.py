@@ -1,10 +1,75 @@
 import json
-import re
+import mmap
+import os
 from datetime import datetime, timedelta
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # Optional; falls back to stdlib json
+    orjson = None
+
 from scraper import config
 from scraper.pipeline.r2 import download_from_r2
 
+# Entries start with a fixed-width "[YYYY-MM-DD HH:MM:SS]" stamp
+LOG_TIMESTAMP_END = len("[YYYY-MM-DD HH:MM:SS]") - 1
+# Files at least this big are parsed straight from a memory map instead of
+# being copied into a bytes object first (only when orjson is available)
+JSON_MMAP_MIN_BYTES = 1 << 20
+
+
+def loads_json(data):
+    """Decode JSON from str or bytes, using orjson's C decoder when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def read_json(path):
+    """Load JSON from path, memory-mapping large files when orjson can parse the buffer."""
+    with open(path, "rb") as f:
+        if not orjson or os.fstat(f.fileno()).st_size < JSON_MMAP_MIN_BYTES:
+            return loads_json(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def write_json(path, data):
+    """
+    Write data as indented JSON, using orjson's C encoder when available.
+    Writes to a temp file and renames it over path, so a crash mid-write never
+    leaves a truncated file behind for the upload step or the next run.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    if orjson:
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+    tmp_path.replace(path)
+
+
+def _log_line_timestamp(line):
+    """Return the "YYYY-MM-DD HH:MM:SS" stamp that starts an entry line, or None."""
+    if line[:1] == "[" and line[LOG_TIMESTAMP_END:LOG_TIMESTAMP_END + 1] == "]":
+        return line[1:LOG_TIMESTAMP_END]
+    return None
+
+
+def _log_cutoff(retention_days):
+    return (datetime.utcnow() - timedelta(days=retention_days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _oldest_log_timestamp(log_path):
+    """Return the timestamp of the first entry in the log file, or None."""
+    try:
+        with open(log_path, "r") as f:
+            for line in f:
+                timestamp = _log_line_timestamp(line)
+                if timestamp:
+                    return timestamp
+    except FileNotFoundError:
+        pass
+    return None
+
 
 def trim_log_by_time(log_path, retention_days=14):
     """
@@ -14,17 +79,16 @@ def trim_log_by_time(log_path, retention_days=14):
     if not log_path.exists():
         return []
 
-    cutoff = datetime.utcnow() - timedelta(days=retention_days)
-    cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M:%S")
+    cutoff_str = _log_cutoff(retention_days)
 
     kept_lines = []
     current_entry_recent = False
 
     with open(log_path, "r") as f:
         for line in f:
-            match = re.match(r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]", line)
-            if match:
-                current_entry_recent = match.group(1) >= cutoff_str
+            timestamp = _log_line_timestamp(line)
+            if timestamp:
+                current_entry_recent = timestamp >= cutoff_str
 
             if current_entry_recent:
                 kept_lines.append(line)
@@ -32,6 +96,35 @@ def trim_log_by_time(log_path, retention_days=14):
     return kept_lines
 
 
+def append_run_log(log_path, log_lines, retention_days=14, compact_bytes=None):
+    """
+    Append this run's log lines to the log file.
+    The file is only rewritten (trimmed to retention_days) once it grows past
+    compact_bytes or its oldest entry is half a retention window past the
+    cutoff, so most runs cost a read of the first entry and a single append.
+    """
+    compact_bytes = config.LOG_COMPACT_BYTES if compact_bytes is None else compact_bytes
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        log_size = log_path.stat().st_size
+    except FileNotFoundError:
+        log_size = 0
+
+    oldest = _oldest_log_timestamp(log_path) if log_size else None
+    # Slack past the cutoff so a log already covering the full window is not
+    # rewritten on every run just to drop the previous run's entries
+    compact_cutoff = _log_cutoff(retention_days + retention_days // 2)
+    if log_size > compact_bytes or (oldest and oldest < compact_cutoff):
+        kept_lines = trim_log_by_time(log_path, retention_days=retention_days)
+        with open(log_path, "w") as f:
+            f.writelines(kept_lines)
+
+    with open(log_path, "a") as f:
+        f.write("\n--- New Run ---\n")
+        f.writelines(line + "\n" for line in log_lines)
+
+
 def load_existing_events():
     """
     Load existing events from R2 (or local file).
@@ -41,9 +134,7 @@ def load_existing_events():
     download_from_r2("events.json", config.OUTPUT_PATH)
 
     try:
-        if config.OUTPUT_PATH.exists():
-            with open(config.OUTPUT_PATH, "r") as f:
-                return json.load(f)
+        return read_json(config.OUTPUT_PATH)
     except Exception:
         pass
     return []
@@ -54,9 +145,7 @@ def load_seen_cache():
     download_from_r2("seen-cache.json", config.SEEN_CACHE_PATH)
 
     try:
-        if config.SEEN_CACHE_PATH.exists():
-            with open(config.SEEN_CACHE_PATH, "r") as f:
-                return json.load(f)
+        return read_json(config.SEEN_CACHE_PATH)
     except Exception:
         pass
     return {"events": {}, "last_updated": None}
@@ -65,8 +154,7 @@ def load_seen_cache():
 def save_seen_cache(cache):
     """Save seen events cache to disk."""
     config.SEEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(config.SEEN_CACHE_PATH, "w") as f:
-        json.dump(cache, f, indent=2)
+    write_json(config.SEEN_CACHE_PATH, cache)
 
 
 def load_existing_status():
@@ -74,9 +162,7 @@ def load_existing_status():
     download_from_r2("scrape-status.json", config.STATUS_PATH)
 
     try:
-        if config.STATUS_PATH.exists():
-            with open(config.STATUS_PATH, "r") as f:
-                return json.load(f)
+        return read_json(config.STATUS_PATH)
     except Exception:
         pass
     return {"venues": {}}
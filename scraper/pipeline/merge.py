@@ -1,24 +1,35 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 from scraper import config
 
 
+def _event_sort_key(event):
+    return (
+        event.get("date") or "",
+        event.get("show_time") or "",
+        event.get("slug") or "",
+        event.get("ticket_url") or "",
+    )
+
+
 def merge_events(existing_events, new_events):
     """
     Merge new events with existing events.
     - New events update existing ones by ticket_url (primary key)
     - Past events (not in new scrape) are preserved
     - is_new=False is also preserved by slug (in case ticket_url changes)
-    Returns merged list.
+    Returns merged list sorted by date, then show_time, slug and ticket_url,
+    so events sharing a date come out in the same order regardless of source.
     """
     events_by_url = {e.get("ticket_url"): e for e in existing_events if e.get("ticket_url")}
 
-    is_new_false_by_slug = {
-        e.get("slug"): True
+    is_new_false_slugs = {
+        e["slug"]
         for e in existing_events
-        if e.get("slug") and e.get("is_new") is False
+        if e.get("is_new") is False and e.get("slug")
     }
 
+    new_by_url = {}
     for event in new_events:
         url = event.get("ticket_url")
         if url:
@@ -31,49 +42,64 @@ def merge_events(existing_events, new_events):
                 if existing.get("description") and not event.get("description"):
                     event["description"] = existing["description"]
 
-            if event.get("slug") in is_new_false_by_slug:
+            if event.get("slug") in is_new_false_slugs:
                 event["is_new"] = False
 
-            events_by_url[url] = event
+            new_by_url[url] = event
 
-    return list(events_by_url.values())
+    # Kept events come from a sorted events.json and the new batch is sorted
+    # separately, so timsort finds the two runs and merges them in C.
+    kept_events = [e for url, e in events_by_url.items() if url not in new_by_url]
+    scraped_events = sorted(new_by_url.values(), key=_event_sort_key)
+    return sorted(kept_events + scraped_events, key=_event_sort_key)
 
 
-def update_first_seen(events, seen_cache):
+def update_first_seen(events, seen_cache, now_iso=None):
     """
     Update events with first_seen field, calculate is_new, and update the seen cache.
+    now_iso is the run timestamp ("...Z"); defaults to the current UTC time.
     Returns (updated_events, new_event_count).
     """
-    now = datetime.utcnow()
-    now_str = now.isoformat() + "Z"
+    now_str = now_iso or datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+    now = _parse_utc(now_str)
     new_count = 0
+    # Most events share a first_seen value from the same run, so parse each once
+    is_new_by_first_seen = {}
+    seen_events = seen_cache["events"]
 
     for event in events:
         slug = event.get("slug")
         if not slug:
             continue
 
-        if slug in seen_cache["events"]:
-            event["first_seen"] = seen_cache["events"][slug]["first_seen"]
+        seen = seen_events.get(slug)
+        if seen is not None:
+            event["first_seen"] = seen["first_seen"]
         else:
             event["first_seen"] = now_str
-            seen_cache["events"][slug] = {"first_seen": now_str}
+            seen_events[slug] = {"first_seen": now_str}
             new_count += 1
 
         if event.get("is_new") is False:
             pass
         else:
-            try:
-                first_seen_dt = datetime.fromisoformat(event["first_seen"].replace("Z", "+00:00"))
-                first_seen_dt = first_seen_dt.replace(tzinfo=None)
-                days_since_seen = (now - first_seen_dt).total_seconds() / (60 * 60 * 24)
-                event["is_new"] = days_since_seen <= config.NEW_EVENT_DAYS
-            except Exception:
-                event["is_new"] = False
+            first_seen = event["first_seen"]
+            if first_seen not in is_new_by_first_seen:
+                try:
+                    days_since_seen = (now - _parse_utc(first_seen)).total_seconds() / (60 * 60 * 24)
+                    is_new_by_first_seen[first_seen] = days_since_seen <= config.NEW_EVENT_DAYS
+                except Exception:
+                    is_new_by_first_seen[first_seen] = False
+            event["is_new"] = is_new_by_first_seen[first_seen]
 
     return events, new_count
 
 
+def _parse_utc(timestamp):
+    """Parse an ISO timestamp ending in "Z" into a naive UTC datetime."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
 def prune_seen_cache(seen_cache, current_slugs):
     """Remove cache entries for events no longer tracked."""
     seen_cache["events"] = {
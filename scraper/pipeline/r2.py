@@ -76,6 +76,7 @@ def upload_to_r2(log_func=None):
         put(config.SEEN_CACHE_PATH, "seen-cache.json", "application/json")
         put(config.ARTIST_CACHE_PATH, "artist-cache.json", "application/json")
         put(config.SPOTIFY_CACHE_PATH, "artist-spotify-cache.json", "application/json")
+        put(config.AEG_CACHE_PATH, "aeg-cache.json", "application/json")
 
         log(f"Uploaded to R2: {', '.join(uploaded)}")
         return True
@@ -3,31 +3,54 @@
 Spotify artist link enrichment utilities and standalone runner.
 """
 
-import json
 import os
 import re
+import threading
 import time
 import unicodedata
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 import requests
 from bs4 import BeautifulSoup
 
 from scraper import config
+from scraper.pipeline.io import read_json, write_json
 from scraper.pipeline.r2 import download_from_r2
+from scraper.utils.soup import HTML_PARSER
 
 try:
     from tqdm import tqdm  # type: ignore
 except ImportError:
     tqdm = None
 
+ARTIST_STATUS_PREFIX_RE = re.compile(r"^(?:rescheduled|postponed|cancelled|canceled)\s*:\s*")
+ARTIST_PARENTHETICAL_RE = re.compile(r"\([^)]*\)")
+ARTIST_SUPPORT_PREFIX_RE = re.compile(r"^(?:with\s+support\s+from|support\s+from|special guests?:?)\s+")
+ARTIST_FEATURING_RE = re.compile(r"(.+?)\s+\b(feat|ft|featuring|with)\b.*")
+ARTIST_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+ARTIST_WHITESPACE_RE = re.compile(r"\s+")
+ARTIST_SPECIAL_GUESTS_SUFFIX_RE = re.compile(r"\s+(?:plus\s+)?special guests?$")
+SPOTIFY_ARTIST_URL_RE = re.compile(r"open\.spotify\.com/artist/([A-Za-z0-9]+)")
+GENRE_TOKEN_SPLIT_RE = re.compile(r"[\s/,-]+")
+SEARCH_NAME_LEADING_RES = (
+    re.compile(r"^(?:.+?\b(?:presents?|presenta)\b:)\s*(.+)$", re.IGNORECASE),
+    re.compile(r"^(?:with\s+support\s+from|support\s+from|special guests?:?)\s+(.+)$", re.IGNORECASE),
+    re.compile(r"^(?:rescheduled|postponed|cancelled|canceled)\s*:\s*(.+)$", re.IGNORECASE),
+)
+SEARCH_NAME_DASH_SPLIT_RE = re.compile(r"\s+[–—-]\s+")
+SEARCH_NAME_GUESTS_SUFFIX_RE = re.compile(r"(.+?)\s+(?:plus\s+)?special guests?$", re.IGNORECASE)
+SEARCH_NAME_SEPARATOR_RE = re.compile(r"\s+(?:x|with)\s+|,\s*|\s*&\s*|\s*\|\s*", re.IGNORECASE)
+
 # Cache for Spotify artist links (persisted to disk and R2)
 _artist_spotify_cache = {"by_name": {}}
 _spotify_cache_loaded = False
+_spotify_cache_lock = threading.Lock()
 _spotify_token = None
 _spotify_token_expires_at = 0
 SPOTIFY_SEARCH_SOURCE_VERSION = "v3"
+# Keep-alive connections for the many token/search/info-page requests per run
+SPOTIFY_SESSION = requests.Session()
 
 
 def load_spotify_cache():
@@ -36,14 +59,14 @@ def load_spotify_cache():
     download_from_r2("artist-spotify-cache.json", config.SPOTIFY_CACHE_PATH)
 
     try:
-        if config.SPOTIFY_CACHE_PATH.exists():
-            with open(config.SPOTIFY_CACHE_PATH, "r") as f:
-                data = json.load(f)
-                if isinstance(data, dict) and "by_name" in data:
-                    _artist_spotify_cache = data
-                else:
-                    _artist_spotify_cache = {"by_name": {}}
-                print(f"  Loaded {len(_artist_spotify_cache.get('by_name', {}))} cached Spotify links")
+        data = read_json(config.SPOTIFY_CACHE_PATH)
+        if isinstance(data, dict) and "by_name" in data:
+            _artist_spotify_cache = data
+        else:
+            _artist_spotify_cache = {"by_name": {}}
+        print(f"  Loaded {len(_artist_spotify_cache.get('by_name', {}))} cached Spotify links")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"  Warning: Could not load Spotify cache: {e}")
         _artist_spotify_cache = {"by_name": {}}
@@ -55,8 +78,7 @@ def save_spotify_cache():
     """Save Spotify link cache to disk."""
     try:
         config.SPOTIFY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(config.SPOTIFY_CACHE_PATH, "w") as f:
-            json.dump(_artist_spotify_cache, f, indent=2)
+        write_json(config.SPOTIFY_CACHE_PATH, _artist_spotify_cache)
     except Exception as e:
         print(f"  Warning: Could not save Spotify cache: {e}")
 
@@ -67,14 +89,14 @@ def normalize_artist_name(name):
         return ""
     name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
     normalized = name.lower().strip()
-    normalized = re.sub(r"^(?:rescheduled|postponed|cancelled|canceled)\s*:\s*", "", normalized)
-    normalized = re.sub(r"\([^)]*\)", " ", normalized)
-    normalized = re.sub(r"^(?:with\s+support\s+from|support\s+from|special guests?:?)\s+", "", normalized)
-    normalized = re.sub(r"(.+?)\s+\b(feat|ft|featuring|with)\b.*", r"\1", normalized)
+    normalized = ARTIST_STATUS_PREFIX_RE.sub("", normalized)
+    normalized = ARTIST_PARENTHETICAL_RE.sub(" ", normalized)
+    normalized = ARTIST_SUPPORT_PREFIX_RE.sub("", normalized)
+    normalized = ARTIST_FEATURING_RE.sub(r"\1", normalized)
     normalized = normalized.replace("&", " ").replace("+", " ")
-    normalized = re.sub(r"[^a-z0-9\s]", " ", normalized)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    normalized = re.sub(r"\s+(?:plus\s+)?special guests?$", "", normalized).strip()
+    normalized = ARTIST_NON_ALNUM_RE.sub(" ", normalized)
+    normalized = ARTIST_WHITESPACE_RE.sub(" ", normalized).strip()
+    normalized = ARTIST_SPECIAL_GUESTS_SUFFIX_RE.sub("", normalized).strip()
     return normalized
 
 
@@ -99,7 +121,7 @@ def extract_spotify_artist_id(url):
         return None
     if url.startswith("spotify:artist:"):
         return url.split(":")[-1]
-    match = re.search(r"open\.spotify\.com/artist/([A-Za-z0-9]+)", url)
+    match = SPOTIFY_ARTIST_URL_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -117,9 +139,12 @@ def normalize_spotify_url(url):
 
 
 def ensure_spotify_cache_loaded():
-    """Lazy-load Spotify cache."""
-    if not _spotify_cache_loaded:
-        load_spotify_cache()
+    """Lazy-load Spotify cache (venue scrapers may call this from worker threads)."""
+    if _spotify_cache_loaded:
+        return
+    with _spotify_cache_lock:
+        if not _spotify_cache_loaded:
+            load_spotify_cache()
 
 
 def get_spotify_cache_entry(normalized_name):
@@ -155,7 +180,7 @@ def cache_spotify_result(artist_name, spotify_url, source, updated_at=None):
 
 def extract_spotify_links_from_html(html):
     """Extract Spotify artist links from HTML and return list of {url, text}."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     links = []
     for anchor in soup.find_all("a", href=True):
         href = anchor.get("href") or ""
@@ -184,7 +209,7 @@ def get_spotify_token():
         return _spotify_token
 
     try:
-        resp = requests.post(
+        resp = SPOTIFY_SESSION.post(
             config.SPOTIFY_TOKEN_URL,
             data={"grant_type": "client_credentials"},
             auth=(config.SPOTIFY_CLIENT_ID, config.SPOTIFY_CLIENT_SECRET),
@@ -204,9 +229,9 @@ def get_spotify_token():
 def _genres_overlap(genre_hint, candidate_genres):
     if not genre_hint or not candidate_genres:
         return False
-    hint_tokens = set(re.split(r"[\s/,-]+", genre_hint.lower()))
+    hint_tokens = set(GENRE_TOKEN_SPLIT_RE.split(genre_hint.lower()))
     for genre in candidate_genres:
-        genre_tokens = set(re.split(r"[\s/,-]+", genre.lower()))
+        genre_tokens = set(GENRE_TOKEN_SPLIT_RE.split(genre.lower()))
         if hint_tokens & genre_tokens:
             return True
     return False
@@ -308,17 +333,12 @@ def spotify_search_names(artist_name):
             variants.append(value)
 
     add(artist_name)
-    add(re.sub(r"\([^)]*\)", " ", artist_name))
+    add(ARTIST_PARENTHETICAL_RE.sub(" ", artist_name))
 
     pending = [artist_name]
-    leading_patterns = [
-        r"^(?:.+?\b(?:presents?|presenta)\b:)\s*(.+)$",
-        r"^(?:with\s+support\s+from|support\s+from|special guests?:?)\s+(.+)$",
-        r"^(?:rescheduled|postponed|cancelled|canceled)\s*:\s*(.+)$",
-    ]
     for value in list(pending):
-        for pattern in leading_patterns:
-            match = re.match(pattern, value, flags=re.IGNORECASE)
+        for pattern in SEARCH_NAME_LEADING_RES:
+            match = pattern.match(value)
             if match:
                 add(match.group(1))
                 pending.append(match.group(1))
@@ -328,17 +348,17 @@ def spotify_search_names(artist_name):
         if len(colon_parts) > 1:
             add(colon_parts[0])
 
-        dash_parts = [part.strip() for part in re.split(r"\s+[–—-]\s+", value) if part.strip()]
+        dash_parts = [part.strip() for part in SEARCH_NAME_DASH_SPLIT_RE.split(value) if part.strip()]
         if len(dash_parts) > 1:
             add(dash_parts[0])
 
-        suffix_match = re.match(r"(.+?)\s+(?:plus\s+)?special guests?$", value, flags=re.IGNORECASE)
+        suffix_match = SEARCH_NAME_GUESTS_SUFFIX_RE.match(value)
         if suffix_match:
             add(suffix_match.group(1))
 
         separator_parts = [
             part.strip()
-            for part in re.split(r"\s+(?:x|with)\s+|,\s*|\s*&\s*|\s*\|\s*", value, flags=re.IGNORECASE)
+            for part in SEARCH_NAME_SEPARATOR_RE.split(value)
             if part.strip()
         ]
         if 1 < len(separator_parts) <= 4:
@@ -372,7 +392,7 @@ def spotify_search_artist(artist_name, genre_hint=None):
 
             for attempt in range(2):
                 try:
-                    resp = requests.get(config.SPOTIFY_SEARCH_URL, headers=headers, params=params, timeout=10)
+                    resp = SPOTIFY_SESSION.get(config.SPOTIFY_SEARCH_URL, headers=headers, params=params, timeout=10)
                 except requests.exceptions.RequestException:
                     if attempt == 0:
                         continue
@@ -423,8 +443,8 @@ def spotify_search_artist(artist_name, genre_hint=None):
 
 def _parse_event_date(date_str):
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
-    except Exception:
+        return date.fromisoformat(date_str)
+    except (TypeError, ValueError):
         return None
 
 
@@ -508,7 +528,7 @@ def enrich_events_with_spotify(events, run_timestamp=None, log_func=None, search
             links = info_url_cache.get(info_url)
             if links is None:
                 try:
-                    resp = requests.get(info_url, headers=config.SPOTIFY_HTML_HEADERS, timeout=20)
+                    resp = SPOTIFY_SESSION.get(info_url, headers=config.SPOTIFY_HTML_HEADERS, timeout=20)
                     if resp.ok:
                         links = extract_spotify_links_from_html(resp.text)
                     else:
@@ -607,19 +627,18 @@ def enrich_events_with_spotify(events, run_timestamp=None, log_func=None, search
 
 def run_spotify_enrichment(events_path=config.OUTPUT_PATH, search_limit=None, log_func=None):
     log = log_func or print
-    if not Path(events_path).exists():
+    events_path = Path(events_path)
+    if not events_path.exists():
         log(f"Events file not found: {events_path}")
         return False
 
-    with open(events_path, "r") as f:
-        events = json.load(f)
+    events = read_json(events_path)
 
     run_timestamp = datetime.utcnow().isoformat() + "Z"
     events = enrich_events_with_spotify(events, run_timestamp=run_timestamp, log_func=log, search_limit=search_limit)
     save_spotify_cache()
 
-    with open(events_path, "w") as f:
-        json.dump(events, f, indent=2)
+    write_json(events_path, events)
 
     log(f"Spotify enrichment complete. Updated {len(events)} events.")
     return True
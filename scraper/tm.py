@@ -1,12 +1,17 @@
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from scraper import config
 from scraper import spotify_enrichment
+from scraper.pipeline.io import loads_json, read_json, write_json
 from scraper.utils.categories import map_tm_classification
 from scraper.utils.dates import normalize_time
 from scraper.utils.descriptions import clean_description
+from scraper.utils.events import EMPTY_MAPPING, NO_ARTISTS
+from scraper.utils.http import TokenBucket
 
 TM_VENUES = {
     "Center Stage": "KovZpa2gA5",
@@ -19,6 +24,13 @@ TM_VENUES = {
     "The Masquerade - Altar": "KovZ917AmQG",
 }
 
+# Venues scraped from the Discovery API already carry TM classifications
+TM_VENUE_NAMES = frozenset({
+    "Center Stage", "The Loft", "Vinyl",
+    "State Farm Arena",
+    "The Masquerade",
+})
+
 TM_CATEGORY_MAP = {
     "Music": "concerts",
     "Sports": "sports",
@@ -39,6 +51,21 @@ TM_CATEGORY_MAP = {
 _artist_classification_cache = {}
 TM_ARTIST_TIMEOUT = (5, 10)
 TM_EVENTS_TIMEOUT = (8, 20)
+TM_ARTIST_LOOKUP_WORKERS = 5
+# Shared by the TM venue scrapers (run concurrently) and artist lookups;
+# the Discovery API allows 5 requests/second.
+TM_RATE_LIMITER = TokenBucket(rate=5, capacity=5)
+
+
+def _create_tm_session():
+    """Keep-alive session for all Discovery API calls, retrying rate limits and 5xx."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_maxsize=10, max_retries=retries))
+    return session
+
+
+TM_SESSION = _create_tm_session()
 
 
 def _extract_tm_spotify_url(external_links):
@@ -61,10 +88,10 @@ def load_artist_cache():
     download_from_r2("artist-cache.json", config.ARTIST_CACHE_PATH)
 
     try:
-        if config.ARTIST_CACHE_PATH.exists():
-            with open(config.ARTIST_CACHE_PATH, "r") as f:
-                _artist_classification_cache = json.load(f)
-                print(f"  Loaded {len(_artist_classification_cache)} cached artist classifications")
+        _artist_classification_cache = read_json(config.ARTIST_CACHE_PATH)
+        print(f"  Loaded {len(_artist_classification_cache)} cached artist classifications")
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"  Warning: Could not load artist cache: {e}")
         _artist_classification_cache = {}
@@ -74,8 +101,7 @@ def save_artist_cache():
     """Save artist classification cache to disk."""
     try:
         config.ARTIST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(config.ARTIST_CACHE_PATH, "w") as f:
-            json.dump(_artist_classification_cache, f, indent=2)
+        write_json(config.ARTIST_CACHE_PATH, _artist_classification_cache)
     except Exception as e:
         print(f"  Warning: Could not save artist cache: {e}")
 
@@ -100,22 +126,22 @@ def get_artist_classification(artist_name):
             "size": 1,
             "apikey": config.TM_API_KEY,
         }
-        resp = requests.get(f"{config.TM_BASE_URL}/attractions.json", params=params, timeout=TM_ARTIST_TIMEOUT)
+        TM_RATE_LIMITER.acquire()
+        resp = TM_SESSION.get(f"{config.TM_BASE_URL}/attractions.json", params=params, timeout=TM_ARTIST_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        data = loads_json(resp.content)
 
-        attractions = data.get("_embedded", {}).get("attractions", [])
+        attractions = data.get("_embedded", EMPTY_MAPPING).get("attractions", ())
         if attractions:
             attraction = attractions[0]
-            classifications = attraction.get("classifications", [])
+            classifications = attraction.get("classifications", ())
             category = map_tm_classification(classifications, TM_CATEGORY_MAP)
             _artist_classification_cache[cache_key] = category
 
-            spotify_url = _extract_tm_spotify_url(attraction.get("externalLinks", {}))
+            spotify_url = _extract_tm_spotify_url(attraction.get("externalLinks", EMPTY_MAPPING))
             if spotify_url:
                 spotify_enrichment.cache_spotify_result(artist_name, spotify_url, source="tm-attraction")
 
-            time.sleep(0.2)
             return category
 
     except Exception as e:
@@ -140,23 +166,24 @@ def scrape_tm_venue(venue_id, venue_name, stage=None):
     }
 
     try:
-        resp = requests.get(f"{config.TM_BASE_URL}/events.json", params=params, timeout=TM_EVENTS_TIMEOUT)
+        TM_RATE_LIMITER.acquire()
+        resp = TM_SESSION.get(f"{config.TM_BASE_URL}/events.json", params=params, timeout=TM_EVENTS_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        data = loads_json(resp.content)
     except Exception as e:
         print(f"    {venue_name}: ERROR - {e}")
         return []
 
     events = []
-    for tm_event in data.get("_embedded", {}).get("events", []):
-        start = tm_event.get("dates", {}).get("start", {})
+    for tm_event in data.get("_embedded", EMPTY_MAPPING).get("events", ()):
+        start = tm_event.get("dates", EMPTY_MAPPING).get("start", EMPTY_MAPPING)
         event_date = start.get("localDate")
         event_time = start.get("localTime")
 
         if not event_date:
             continue
 
-        attractions = tm_event.get("_embedded", {}).get("attractions", [])
+        attractions = tm_event.get("_embedded", EMPTY_MAPPING).get("attractions", ())
         artists = []
         for attr in attractions:
             artist_name = attr.get("name")
@@ -165,11 +192,11 @@ def scrape_tm_venue(venue_id, venue_name, stage=None):
 
             artist = {"name": artist_name}
             if attr.get("classifications"):
-                genre = attr["classifications"][0].get("genre", {}).get("name")
+                genre = attr["classifications"][0].get("genre", EMPTY_MAPPING).get("name")
                 if genre:
                     artist["genre"] = genre
 
-            spotify_url = _extract_tm_spotify_url(attr.get("externalLinks", {}))
+            spotify_url = _extract_tm_spotify_url(attr.get("externalLinks", EMPTY_MAPPING))
             if spotify_url:
                 artist["spotify_url"] = spotify_url
                 spotify_enrichment.cache_spotify_result(artist_name, spotify_url, source="tm-event")
@@ -180,7 +207,7 @@ def scrape_tm_venue(venue_id, venue_name, stage=None):
             artists = [{"name": tm_event.get("name", "Unknown")}]
 
         price = None
-        price_ranges = tm_event.get("priceRanges", [])
+        price_ranges = tm_event.get("priceRanges", ())
         if price_ranges:
             pr = price_ranges[0]
             min_p, max_p = pr.get("min"), pr.get("max")
@@ -190,15 +217,16 @@ def scrape_tm_venue(venue_id, venue_name, stage=None):
                 else:
                     price = f"${min_p:.0f} - ${max_p:.0f}"
 
-        category = map_tm_classification(tm_event.get("classifications", []), TM_CATEGORY_MAP)
+        category = map_tm_classification(tm_event.get("classifications", ()), TM_CATEGORY_MAP)
 
+        images = tm_event.get("images") or []
         image_url = None
-        for img in tm_event.get("images", []):
+        for img in images:
             if img.get("ratio") == "16_9" and img.get("width", 0) >= 600:
                 image_url = img.get("url")
                 break
-        if not image_url and tm_event.get("images"):
-            image_url = tm_event["images"][0].get("url")
+        if not image_url and images:
+            image_url = images[0].get("url")
 
         event = {
             "venue": venue_name,
@@ -225,18 +253,27 @@ def scrape_tm_venue(venue_id, venue_name, stage=None):
     return events
 
 
+def scrape_tm_stages(venue_name, stages):
+    """
+    Scrape several (stage_name, venue_id) TM venues that make up one venue.
+    Stages are fetched concurrently and returned in stage order.
+    """
+    with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+        results = executor.map(
+            lambda stage: scrape_tm_venue(stage[1], venue_name, stage=stage[0]),
+            stages,
+        )
+        return [event for events in results for event in events]
+
+
 def scrape_center_stage_tm():
     """Scrape Center Stage, The Loft, and Vinyl via Ticketmaster API."""
-    all_events = []
     stages = [
         ("Main", TM_VENUES["Center Stage"]),
         ("The Loft", TM_VENUES["The Loft"]),
         ("Vinyl", TM_VENUES["Vinyl"]),
     ]
-
-    for stage_name, venue_id in stages:
-        events = scrape_tm_venue(venue_id, "Center Stage", stage=stage_name)
-        all_events.extend(events)
+    all_events = scrape_tm_stages("Center Stage", stages)
 
     print(f"    Center Stage complex (TM): {len(all_events)} events")
     return all_events
@@ -249,17 +286,13 @@ def scrape_state_farm_arena_tm():
 
 
 def scrape_masquerade_tm():
-    all_events = []
     stages = [
         ("Heaven", TM_VENUES["The Masquerade - Heaven"]),
         ("Hell", TM_VENUES["The Masquerade - Hell"]),
         ("Purgatory", TM_VENUES["The Masquerade - Purgatory"]),
         ("Altar", TM_VENUES["The Masquerade - Altar"]),
     ]
-
-    for stage_name, venue_id in stages:
-        events = scrape_tm_venue(venue_id, "The Masquerade", stage=stage_name)
-        all_events.extend(events)
+    all_events = scrape_tm_stages("The Masquerade", stages)
 
     print(f"    The Masquerade (TM): {len(all_events)} events")
     return all_events
@@ -275,43 +308,38 @@ def enrich_events_with_tm(events):
     if not config.TM_API_KEY:
         return events
 
-    tm_venue_names = {
-        "Center Stage", "The Loft", "Vinyl",
-        "State Farm Arena",
-        "The Masquerade",
-    }
-
     enriched_count = 0
     api_calls = 0
     cache_hits = 0
 
     def should_enrich(event):
-        if event.get("venue") in tm_venue_names:
+        if event.get("venue") in TM_VENUE_NAMES:
             return False
-        artists = event.get("artists", [])
+        artists = event.get("artists", ())
         if not artists or artists[0].get("genre"):
             return False
         if event.get("category") not in [None, "concerts", config.DEFAULT_CATEGORY]:
             return False
         return True
 
-    artists_to_lookup = set()
-    for event in events:
-        if not should_enrich(event):
-            continue
-        headliner = event.get("artists", [{}])[0].get("name", "").lower().strip()
-        if headliner and headliner not in _artist_classification_cache:
-            artists_to_lookup.add(headliner)
-
-    for artist_name in artists_to_lookup:
-        get_artist_classification(artist_name)
-        api_calls += 1
+    # Filter once and reuse the (event, headliner) pairs for lookup and apply
+    pending = [
+        (event, event.get("artists", NO_ARTISTS)[0].get("name", "").lower().strip())
+        for event in events
+        if should_enrich(event)
+    ]
+    artists_to_lookup = {
+        headliner
+        for _, headliner in pending
+        if headliner and headliner not in _artist_classification_cache
+    }
 
-    for event in events:
-        if not should_enrich(event):
-            continue
+    # Lookups are independent; TM_RATE_LIMITER keeps them within the API budget.
+    with ThreadPoolExecutor(max_workers=TM_ARTIST_LOOKUP_WORKERS) as executor:
+        for _ in executor.map(get_artist_classification, artists_to_lookup):
+            api_calls += 1
 
-        headliner = event.get("artists", [{}])[0].get("name", "").lower().strip()
+    for event, headliner in pending:
         if headliner in _artist_classification_cache:
             category = _artist_classification_cache[headliner]
             if headliner not in artists_to_lookup:
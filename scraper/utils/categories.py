@@ -1,4 +1,7 @@
 import re
+from functools import lru_cache
+
+from scraper.utils.events import EMPTY_MAPPING
 
 CATEGORY_PRIORITY = {
     "broadway": 0,
@@ -9,6 +12,50 @@ CATEGORY_PRIORITY = {
 }
 
 
+SPORTS_KEYWORDS = [
+    "sports",
+    "basketball", "hoops", "hoopsgiving", "nba",
+    "football", "nfl", "gridiron",
+    "soccer", "mls", "fifa",
+    "hockey", "nhl",
+    "baseball", "mlb",
+    "wrestling", "wwe", "aew", "raw", "smackdown",
+    "boxing", "ufc", "mma", "fight night",
+    "championship", "tournament", "playoffs",
+]
+
+COMEDY_KEYWORDS = [
+    "comedy",
+    "comedian",
+    "stand-up",
+    "standup",
+    "improv",
+    "laugh",
+]
+
+CONCERT_KEYWORDS = [
+    "concert",
+    "concerts",
+    "tour",
+    "jam",
+    "fest",
+    "festival",
+    "live music",
+    "in concert",
+]
+
+
+def _keyword_pattern(keywords):
+    """Compile keywords into one substring alternation (longest first)."""
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+
+SPORTS_RE = re.compile(rf"{_keyword_pattern(SPORTS_KEYWORDS).pattern}|\bvs\.?\b")
+COMEDY_RE = _keyword_pattern(COMEDY_KEYWORDS)
+CONCERT_RE = _keyword_pattern(CONCERT_KEYWORDS)
+
+
 def detect_category_from_text(text):
     """
     Detect event category from text (title or URL path) using keyword analysis.
@@ -18,47 +65,19 @@ def detect_category_from_text(text):
     if not text:
         return None
 
-    text_lower = text.lower()
-
-    sports_patterns = [
-        "sports",
-        "basketball", "hoops", "hoopsgiving", "nba",
-        "football", "nfl", "gridiron",
-        "soccer", "mls", "fifa",
-        "hockey", "nhl",
-        "baseball", "mlb",
-        "wrestling", "wwe", "aew", "raw", "smackdown",
-        "boxing", "ufc", "mma", "fight night",
-        "championship", "tournament", "playoffs",
-    ]
-
-    if any(pattern in text_lower for pattern in sports_patterns) or re.search(r"\bvs\.?\b", text_lower):
-        return "sports"
+    return _detect_category_lower(text.lower())
+
 
-    comedy_patterns = [
-        "comedy",
-        "comedian",
-        "stand-up",
-        "standup",
-        "improv",
-        "laugh",
-    ]
+@lru_cache(maxsize=512)
+def _detect_category_lower(text_lower):
+    """Keyword scan behind detect_category_from_text, cached per lowercased text."""
+    if SPORTS_RE.search(text_lower):
+        return "sports"
 
-    if any(pattern in text_lower for pattern in comedy_patterns):
+    if COMEDY_RE.search(text_lower):
         return "comedy"
 
-    concert_patterns = [
-        "concert",
-        "concerts",
-        "tour",
-        "jam",
-        "fest",
-        "festival",
-        "live music",
-        "in concert",
-    ]
-
-    if any(pattern in text_lower for pattern in concert_patterns):
+    if CONCERT_RE.search(text_lower):
         return "concerts"
 
     return None
@@ -94,8 +113,8 @@ def map_tm_classification(classifications, category_map):
         return "concerts"
 
     primary = classifications[0] if classifications else {}
-    segment = primary.get("segment", {}).get("name", "")
-    genre = primary.get("genre", {}).get("name", "")
+    segment = primary.get("segment", EMPTY_MAPPING).get("name", "")
+    genre = primary.get("genre", EMPTY_MAPPING).get("name", "")
 
     if genre in category_map:
         return category_map[genre]
@@ -1,4 +1,21 @@
 import re
+from datetime import date
+
+TIME_RE = re.compile(r"(\d{1,2}):(\d{2})(?::\d{2})?\s*(?:([ap])\.?m\.?)?", re.IGNORECASE)
+MONTH_NUMBERS = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+            ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+            ("september", "sep"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+MONTH_DAY_YEAR_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})")
+MONTH_YEAR_RE = re.compile(r"([A-Za-z]+)\s+(\d{4})")
 
 
 def normalize_time(time_str):
@@ -10,30 +27,60 @@ def normalize_time(time_str):
     if not time_str:
         return None
 
-    time_str = time_str.strip().lower()
-    match = re.search(r"(\d{1,2}:\d{2})(?::\d{2})?\s*([ap]\.?m\.?)?", time_str)
+    # Fast path: already "HH:MM" (AEG, Live Nation after slicing)
+    if (
+        len(time_str) == 5
+        and time_str[2] == ":"
+        and time_str.isascii()
+        and time_str[:2].isdigit()
+        and time_str[3:].isdigit()
+    ):
+        return time_str
+
+    match = TIME_RE.search(time_str)
     if not match:
         return None
 
-    time_str = match.group(1)
-    meridiem = (match.group(2) or "").replace(".", "")
+    hours = int(match.group(1))
+    minutes = int(match.group(2))
+    meridiem = (match.group(3) or "").lower()
 
-    is_pm = meridiem == "pm"
-    is_am = meridiem == "am"
+    if meridiem == "p" and hours < 12:
+        hours += 12
+    elif meridiem == "a" and hours == 12:
+        hours = 0
+
+    return f"{hours:02d}:{minutes:02d}"
 
-    parts = time_str.split(":")
-    if len(parts) != 2:
-        return None
 
+def iso_date(year, month, day=1):
+    """
+    Build a "YYYY-MM-DD" string from text parts such as ("2026", "Feb", "10").
+    Month may be a full English name or its 3-letter abbreviation.
+    Returns None for unknown months or impossible dates.
+    """
+    month_number = MONTH_NUMBERS.get(month.strip().lower())
+    if not month_number:
+        return None
     try:
-        hours = int(parts[0])
-        minutes = int(parts[1])
+        return date(int(year), month_number, int(day)).isoformat()
     except ValueError:
         return None
 
-    if is_pm and hours < 12:
-        hours += 12
-    elif is_am and hours == 12:
-        hours = 0
 
-    return f"{hours:02d}:{minutes:02d}"
+def parse_month_day_year(text):
+    """Parse "Feb 10, 2026" or "February 10, 2026" into "YYYY-MM-DD"."""
+    match = MONTH_DAY_YEAR_RE.fullmatch(text)
+    if not match:
+        return None
+    month, day, year = match.groups()
+    return iso_date(year, month, day)
+
+
+def parse_month_year(text):
+    """Parse "February 2026" into the first of the month ("2026-02-01")."""
+    match = MONTH_YEAR_RE.fullmatch(text)
+    if not match:
+        return None
+    month, year = match.groups()
+    return iso_date(year, month)
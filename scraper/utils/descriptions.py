@@ -3,6 +3,8 @@ import re
 
 from bs4 import BeautifulSoup
 
+from scraper.utils.soup import HTML_PARSER
+
 
 SOCIAL_LINK_TEXT = {
     "bandcamp",
@@ -62,6 +64,9 @@ PROMO_KEYWORDS = [
     "tour",
 ]
 
+WHITESPACE_RE = re.compile(r"\s+")
+WORD_RE = re.compile(r"\w+")
+
 
 def clean_description(value, heading=None):
     """Return cleaned plain text for event descriptions, or None if unusable."""
@@ -93,7 +98,7 @@ def extract_first_description(soup, selectors, heading=None):
 
 
 def _plain_text(value):
-    soup = BeautifulSoup(value, "html.parser")
+    soup = BeautifulSoup(value, HTML_PARSER)
     for tag in soup(["script", "style", "noscript", "svg"]):
         tag.decompose()
     for br in soup.find_all("br"):
@@ -107,7 +112,7 @@ def _plain_text(value):
 def _normalize_description_text(text):
     lines = []
     for line in text.splitlines():
-        cleaned = re.sub(r"\s+", " ", line).strip()
+        cleaned = WHITESPACE_RE.sub(" ", line).strip()
         if cleaned:
             lines.append(cleaned)
     return "\n\n".join(lines).strip()
@@ -116,7 +121,7 @@ def _normalize_description_text(text):
 def _drop_social_lines(text):
     lines = []
     for line in text.splitlines():
-        normalized = re.sub(r"\s+", " ", line).strip()
+        normalized = WHITESPACE_RE.sub(" ", line).strip()
         if not normalized:
             continue
         if normalized.lower() in SOCIAL_LINK_TEXT:
@@ -126,7 +131,7 @@ def _drop_social_lines(text):
 
 
 def _remove_leading_heading(text, heading):
-    normalized_heading = re.sub(r"\s+", " ", heading or "").strip()
+    normalized_heading = WHITESPACE_RE.sub(" ", heading or "").strip()
     if not normalized_heading:
         return text
 
@@ -142,7 +147,7 @@ def _remove_leading_heading(text, heading):
 
 def _looks_logistics_only(text):
     lower = text.lower()
-    word_count = len(re.findall(r"\w+", lower))
+    word_count = len(WORD_RE.findall(lower))
     logistics_hits = sum(1 for keyword in LOGISTICS_KEYWORDS if keyword in lower)
     promo_hits = sum(1 for keyword in PROMO_KEYWORDS if keyword in lower)
 
@@ -1,4 +1,36 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
+
+SLUG_INVALID_CHARS_RE = re.compile(r"[^\w\s-]")
+SLUG_SEPARATORS_RE = re.compile(r"[\s_]+")
+SLUG_REPEATED_HYPHENS_RE = re.compile(r"-+")
+ZERO_PRICE_RE = re.compile(r"^\$0(\.0+)?(\s*-\s*\$0(\.0+)?)?$")
+DOLLAR_AMOUNT_RE = re.compile(r"\$[\d.]+")
+# Shared read-only defaults for .get() chains, so a missing key does not
+# allocate a fresh {} / [{}] on every call
+EMPTY_MAPPING = MappingProxyType({})
+NO_ARTISTS = (EMPTY_MAPPING,)
+# ASCII-only equivalent of the two regex passes above: separators become "-",
+# invalid characters are dropped, word characters and "-" are kept
+SLUG_ASCII_TABLE = str.maketrans({
+    char: "-" if SLUG_SEPARATORS_RE.fullmatch(char) else None
+    for char in map(chr, range(128))
+    if SLUG_SEPARATORS_RE.fullmatch(char) or SLUG_INVALID_CHARS_RE.fullmatch(char)
+})
+
+
+@lru_cache(maxsize=1024)
+def slugify(text):
+    """Lowercase text and collapse it to hyphen-separated word characters."""
+    text = text.lower().strip()
+    if text.isascii():
+        text = text.translate(SLUG_ASCII_TABLE)
+    else:
+        text = SLUG_INVALID_CHARS_RE.sub("", text)
+        text = SLUG_SEPARATORS_RE.sub("-", text)
+    text = SLUG_REPEATED_HYPHENS_RE.sub("-", text)
+    return text.strip("-")
 
 
 def generate_slug(event):
@@ -10,14 +42,7 @@ def generate_slug(event):
     date = event.get("date", "")
     venue = event.get("venue", "")
     stage = event.get("stage", "")
-    artist = event.get("artists", [{}])[0].get("name", "unknown")
-
-    def slugify(text):
-        text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[\s_]+", "-", text)
-        text = re.sub(r"-+", "-", text)
-        return text.strip("-")
+    artist = event.get("artists", NO_ARTISTS)[0].get("name", "unknown")
 
     slug_parts = [date, slugify(venue), slugify(stage), slugify(artist)]
     return "-".join(filter(None, slug_parts))
@@ -27,12 +52,9 @@ def is_zero_price(price_str):
     """Check if a price string represents $0 or free."""
     if not price_str:
         return True
-    zero_patterns = [r"^\$0(\.0+)?$", r"^\$0(\.0+)?\s*-\s*\$0(\.0+)?$"]
-    price_clean = price_str.strip()
-    for pattern in zero_patterns:
-        if re.match(pattern, price_clean):
-            return True
-    return False
+    price_str = price_str.strip()
+    # Only "$0..." strings can match; skips the regex for real prices and text
+    return price_str.startswith("$0") and bool(ZERO_PRICE_RE.match(price_str))
 
 
 def normalize_price(event):
@@ -47,8 +69,8 @@ def normalize_price(event):
         adv = event.get("adv_price", "")
         dos = event.get("dos_price", "")
         if adv and dos:
-            adv_match = re.search(r"\$[\d.]+", adv)
-            dos_match = re.search(r"\$[\d.]+", dos)
+            adv_match = DOLLAR_AMOUNT_RE.search(adv)
+            dos_match = DOLLAR_AMOUNT_RE.search(dos)
             if adv_match and dos_match:
                 price = f"{adv_match.group()} ADV / {dos_match.group()} DOS"
             else:
@@ -0,0 +1,58 @@
+"""Shared HTTP session construction and request pacing."""
+import threading
+import time
+
+import requests
+
+from scraper import config
+
+try:
+    import requests_cache  # type: ignore
+except ImportError:  # Optional; only needed for the local HTTP cache
+    requests_cache = None
+
+
+def create_session():
+    """
+    Return a requests session for venue scrapers.
+    When HTTP_CACHE_SECONDS is set and requests-cache is installed, responses are
+    cached on disk (honoring Cache-Control/ETag) to skip refetches between runs.
+    """
+    if requests_cache and config.HTTP_CACHE_SECONDS > 0:
+        return requests_cache.CachedSession(
+            str(config.HTTP_CACHE_PATH),
+            backend="sqlite",
+            cache_control=True,
+            expire_after=config.HTTP_CACHE_SECONDS,
+            allowable_methods=("GET", "POST"),
+        )
+    return requests.Session()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Allows bursts of up to `capacity` requests, then paces callers to `rate`
+    requests per second instead of sleeping a fixed delay between requests.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (possibly going negative) so concurrent
+            # callers queue up behind each other rather than all waking at once.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
@@ -0,0 +1,48 @@
+"""Shared BeautifulSoup parser selection."""
+import re
+
+from bs4 import NavigableString, SoupStrainer
+
+try:
+    import lxml  # type: ignore  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:  # Optional; falls back to the pure-Python parser
+    HTML_PARSER = "html.parser"
+
+
+def class_strainer(*class_names, name=None):
+    """
+    Build a SoupStrainer that keeps only elements carrying one of class_names.
+    Matches the raw class attribute with a regex so multi-class elements
+    (e.g. "events--item w-dyn-item") are kept on every bs4 version.
+    """
+    classes = "|".join(re.escape(class_name) for class_name in class_names)
+    return SoupStrainer(name, class_=re.compile(rf"(?:^|\s)(?:{classes})(?:\s|$)"))
+
+
+def first_link(links, classes=(), href_contains=()):
+    """
+    Return the first <a> in links that has one of classes or whose href
+    contains one of href_contains, in document order like a CSS selector group
+    ("a.tickets, a[href*='ticketmaster']"). Lets several lookups share one
+    find_all("a") walk instead of each scanning the card's descendants.
+    """
+    for link in links:
+        if classes and not set(classes).isdisjoint(link.attrs.get("class") or ()):
+            return link
+        href = link.attrs.get("href")
+        if href is not None and any(part in href for part in href_contains):
+            return link
+    return None
+
+
+def leaf_text(el):
+    """
+    Stripped text of el, read straight from .string when el wraps a single
+    text node (date parts, tags) instead of walking descendants via get_text.
+    """
+    text = el.string
+    if type(text) is NavigableString:
+        return text.strip()
+    return el.get_text(strip=True)
@@ -1,25 +1,84 @@
-from datetime import datetime
-
-import requests
+import copy
+import re
+import threading
+from datetime import date, time
 
 from scraper import config
+from scraper.pipeline.io import loads_json, read_json, write_json
+from scraper.pipeline.r2 import download_from_r2
 from scraper.utils.dates import normalize_time
 from scraper.utils.descriptions import clean_description
+from scraper.utils.http import create_session
 
 AEG_HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64)",
     "Accept": "application/json",
 }
 AEG_TIMEOUT = (8, 20)
+AEG_DATETIME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})(?:[T ](\d{2}:\d{2}))?")
+# Keep-alive connection shared by all AEG feeds (same blob host)
+AEG_SESSION = create_session()
+
+# Bump when transform_aeg_event output changes so cached events are re-derived
+AEG_CACHE_VERSION = "v1"
+
+# ETag/Last-Modified validators and parsed events per feed URL (persisted to disk and R2)
+_aeg_response_cache = {}
+_aeg_cache_loaded = False
+_aeg_cache_lock = threading.Lock()
+
+
+def load_aeg_cache():
+    """Load AEG conditional-request cache (download from R2 first if available)."""
+    global _aeg_response_cache, _aeg_cache_loaded
+    download_from_r2("aeg-cache.json", config.AEG_CACHE_PATH)
+
+    try:
+        _aeg_response_cache = read_json(config.AEG_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"  Warning: Could not load AEG cache: {e}")
+        _aeg_response_cache = {}
+
+    _aeg_cache_loaded = True
+
+
+def save_aeg_cache():
+    """Save AEG conditional-request cache to disk."""
+    if not _aeg_cache_loaded:
+        return
+    try:
+        config.AEG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        write_json(config.AEG_CACHE_PATH, _aeg_response_cache)
+    except Exception as e:
+        print(f"  Warning: Could not save AEG cache: {e}")
+
+
+def _get_aeg_cache_entry(url):
+    with _aeg_cache_lock:
+        if not _aeg_cache_loaded:
+            load_aeg_cache()
+        entry = _aeg_response_cache.get(url)
+    if not entry or entry.get("version") != AEG_CACHE_VERSION:
+        return None
+    return entry
 
 
 def _parse_aeg_datetime(value):
+    """Split an AEG "YYYY-MM-DD[T ]HH:MM:SS" value into ("YYYY-MM-DD", "HH:MM")."""
     if not value or "TBD" in value:
         return None
+    match = AEG_DATETIME_RE.match(value)
+    if not match:
+        return None
+    date_str, time_str = match.group(1), match.group(2) or "00:00"
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        date.fromisoformat(date_str)
+        time.fromisoformat(time_str)
     except ValueError:
         return None
+    return date_str, time_str
 
 
 def _extract_aeg_artists(title_data):
@@ -79,13 +138,13 @@ def transform_aeg_event(event, venue_name):
     doors_time = None
     door_date = _parse_aeg_datetime(event.get("doorDateTime"))
     if door_date:
-        doors_time = door_date.strftime("%H:%M")
+        doors_time = door_date[1]
 
     transformed = {
         "venue": venue_name,
-        "date": event_date.strftime("%Y-%m-%d"),
+        "date": event_date[0],
         "doors_time": normalize_time(doors_time),
-        "show_time": normalize_time(event_date.strftime("%H:%M")),
+        "show_time": normalize_time(event_date[1]),
         "artists": artists,
         "ticket_url": ticket_url,
         "image_url": _extract_aeg_image(event.get("media")),
@@ -101,11 +160,25 @@ def transform_aeg_event(event, venue_name):
 
 
 def scrape_aeg_venue(url, venue_name):
-    """Scrape events from an AEG venue's JSON API."""
+    """
+    Scrape events from an AEG venue's JSON API.
+    Sends the previous ETag/Last-Modified so an unchanged feed returns 304 and
+    the cached events are reused without downloading or parsing the body.
+    """
+    cached = _get_aeg_cache_entry(url)
+    headers = dict(AEG_HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        resp = requests.get(url, headers=AEG_HEADERS, timeout=AEG_TIMEOUT)
+        resp = AEG_SESSION.get(url, headers=headers, timeout=AEG_TIMEOUT)
+        if resp.status_code == 304 and cached:
+            return copy.deepcopy(cached["events"])
         resp.raise_for_status()
-        data = resp.json()
+        data = loads_json(resp.content)
     except Exception as e:
         print(f"    {venue_name}: ERROR - {e}")
         return []
@@ -116,6 +189,19 @@ def scrape_aeg_venue(url, venue_name):
         if transformed:
             events.append(transformed)
 
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    with _aeg_cache_lock:
+        if etag or last_modified:
+            _aeg_response_cache[url] = {
+                "version": AEG_CACHE_VERSION,
+                "etag": etag,
+                "last_modified": last_modified,
+                "events": copy.deepcopy(events),
+            }
+        else:
+            _aeg_response_cache.pop(url, None)
+
     return events
 
 
@@ -1,12 +1,13 @@
 import time
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 from scraper.utils.dates import normalize_time
 from scraper.utils.categories import detect_category_from_text
 from scraper.utils.descriptions import extract_first_description
+from scraper.utils.http import create_session
+from scraper.utils.soup import HTML_PARSER
 
 CENTER_STAGE_API = "https://www.centerstage-atlanta.com/wp-json/centerstage/v2/events/"
 CENTER_STAGE_HEADERS = {
@@ -69,6 +70,8 @@ def scrape_center_stage():
 
     Note: Ticketmaster Discovery API is preferable when available.
     """
+    session = create_session()
+    session.headers.update(CENTER_STAGE_HEADERS)
     events = []
     description_cache = {}
     page = 1
@@ -80,7 +83,7 @@ def scrape_center_stage():
 
         if url not in description_cache:
             try:
-                resp = requests.get(url, headers=CENTER_STAGE_HEADERS, timeout=CENTER_STAGE_TIMEOUT)
+                resp = session.get(url, timeout=CENTER_STAGE_TIMEOUT)
                 resp.raise_for_status()
                 description_cache[url] = resp.text
                 time.sleep(0.2)
@@ -91,7 +94,7 @@ def scrape_center_stage():
         if not description_cache[url]:
             return None
 
-        soup = BeautifulSoup(description_cache[url], "html.parser")
+        soup = BeautifulSoup(description_cache[url], HTML_PARSER)
         return extract_first_description(
             soup,
             [".event-artist .description", ".description-section .description"],
@@ -101,7 +104,7 @@ def scrape_center_stage():
     while page <= max_pages:
         url = f"{CENTER_STAGE_API}?page={page}"
         try:
-            resp = requests.get(url, headers=CENTER_STAGE_HEADERS, timeout=CENTER_STAGE_TIMEOUT)
+            resp = session.get(url, timeout=CENTER_STAGE_TIMEOUT)
             resp.raise_for_status()
             data = resp.json()
         except Exception as e:
@@ -2,6 +2,7 @@ import datetime as dt
 import itertools
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urlunparse
 
 import requests
@@ -10,6 +11,8 @@ from bs4 import BeautifulSoup
 from scraper import config
 from scraper.utils.dates import normalize_time
 from scraper.utils.descriptions import extract_first_description
+from scraper.utils.http import create_session
+from scraper.utils.soup import HTML_PARSER
 
 EARL_BASE = "https://badearl.com/"
 EARL_PAGE_Q = "?sf_paged={}"
@@ -42,7 +45,7 @@ def _canonicalize_earl_url(url):
 def scrape_earl():
     """Scrape events from The Earl's website."""
     max_retries = 3
-    session = requests.Session()
+    session = create_session()
     session.headers.update(EARL_HEADERS)
     description_cache = {}
 
@@ -87,46 +90,71 @@ def scrape_earl():
         if not description_cache[url]:
             return None
 
-        soup = BeautifulSoup(description_cache[url], "html.parser")
+        soup = BeautifulSoup(description_cache[url], HTML_PARSER)
         return extract_first_description(soup, [".band-details .band-info"], heading=heading)
 
-    def pages():
-        n = 1
-        while True:
-            url = EARL_BASE if n == 1 else EARL_BASE + EARL_PAGE_Q.format(n)
-            text = fetch_with_retry(url)
-            if text is None or "No results found." in text:
-                break
-            yield text
-            n += 1
+    def fetch_page(n):
+        if n > 1:
             time.sleep(random.uniform(1.0, 2.0))
+        return fetch_with_retry(EARL_BASE if n == 1 else EARL_BASE + EARL_PAGE_Q.format(n))
+
+    def pages():
+        # Prefetch page N+1 in the background while page N (and its detail
+        # pages) is being parsed; the page count isn't known up front.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            n = 1
+            pending = executor.submit(fetch_page, n)
+            while True:
+                text = pending.result()
+                if text is None or "No results found." in text:
+                    break
+                n += 1
+                pending = executor.submit(fetch_page, n)
+                yield text
 
     def parse_page(html):
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         for card in soup.select("div.cl-layout__item"):
-            img = card.select_one("div.cl-element-featured_media img")
+            # One walk over the card sorts every field element by tag and class,
+            # instead of a select()/select_one() tree walk per field
+            media = date_tag = adv = dos = None
+            times, headliners, supports = [], [], []
+            links = {}
+            for el in card.find_all(["a", "div", "p"]):
+                classes = el.get("class") or ()
+                if el.name == "p":
+                    if "show-listing-date" in classes and date_tag is None:
+                        date_tag = el
+                    elif "show-listing-time" in classes:
+                        times.append(el.text.strip())
+                    elif "show-listing-price" in classes:
+                        price = el.text.strip()
+                        if adv is None and "ADV" in price:
+                            adv = price
+                        if dos is None and "DOS" in price:
+                            dos = price
+                elif el.name == "div":
+                    if "show-listing-headliner" in classes:
+                        headliners.append(el.text.strip())
+                    elif "show-listing-support" in classes:
+                        supports.append(el.text.strip())
+                    elif "cl-element-featured_media" in classes and media is None:
+                        media = el
+                elif el.get("href") is not None:
+                    links.setdefault(el.string, el["href"])
+
+            img = media.find("img") if media else None
             image_url = img["src"] if img else None
 
-            date_tag = card.select_one("p.show-listing-date")
             if not date_tag:
                 continue
             date = dt.datetime.strptime(date_tag.text.strip(), "%A, %b. %d, %Y").date()
 
-            times = [t.text.strip() for t in card.select("p.show-listing-time")]
             doors = times[0] if times else None
             show = times[1] if len(times) > 1 else None
 
-            prices = [p.text.strip() for p in card.select("p.show-listing-price")]
-            adv = next((p for p in prices if "ADV" in p), None)
-            dos = next((p for p in prices if "DOS" in p), None)
-
-            headliners = [h.text.strip() for h in card.select("div.show-listing-headliner")]
-            supports = [s.text.strip() for s in card.select("div.show-listing-support")]
             artists = headliners + supports
-
-            tix = card.find("a", string="TIX", href=True)
-            info = card.find("a", string="More Info", href=True)
-            info_url = info["href"] if info else None
+            info_url = links.get("More Info")
 
             event = {
                 "venue": "The Earl",
@@ -136,7 +164,7 @@ def scrape_earl():
                 "artists": [{"name": a} for a in artists],
                 "adv_price": adv,
                 "dos_price": dos,
-                "ticket_url": tix["href"] if tix else None,
+                "ticket_url": links.get("TIX"),
                 "info_url": info_url,
                 "image_url": image_url,
                 "category": config.DEFAULT_CATEGORY,
@@ -2,7 +2,9 @@ import json
 import random
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
@@ -13,7 +15,10 @@ except ImportError:
     cloudscraper = None
 
 from scraper import config
+from scraper.pipeline.io import loads_json, read_json
 from scraper.utils.descriptions import extract_first_description
+from scraper.utils.http import TokenBucket, create_session
+from scraper.utils.soup import HTML_PARSER, first_link
 
 FOX_THEATRE_BASE = "https://www.foxtheatre.org"
 FOX_THEATRE_AJAX_HEADERS = {
@@ -35,22 +40,30 @@ FOX_THEATRE_AJAX_HEADERS = {
     "Pragma": "no-cache",
 }
 FOX_THEATRE_TIMEOUT = (8, 20)
+FOX_THEATRE_DESCRIPTION_WORKERS = 4
+# Paces detail-page requests across the description workers (they share one session)
+FOX_THEATRE_DESCRIPTION_RATE_LIMITER = TokenBucket(rate=2, capacity=2)
+
+FOX_MONTH_ABBREVIATIONS = {
+    "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
+    "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
+    "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec",
+}
+FOX_FULL_MONTH_RE = re.compile(rf"\b({'|'.join(FOX_MONTH_ABBREVIATIONS)})\b", re.IGNORECASE)
+FOX_SPACE_BEFORE_COMMA_RE = re.compile(r"\s+,")
+FOX_SINGLE_DATE_RE = re.compile(r"^([A-Za-z]+)\s+(\d+),\s*(\d{4})$")
+FOX_SAME_MONTH_RANGE_RE = re.compile(r"^([A-Za-z]+)\s+(\d+)-(\d+),\s*(\d{4})$")
+FOX_CROSS_MONTH_RANGE_RE = re.compile(r"^([A-Za-z]+)\s+(\d+)-([A-Za-z]+)\s+(\d+),\s*(\d{4})$")
+FOX_CARD_DATE_RE = re.compile(r"([A-Z][a-z]{2,}\s+\d+(?:-(?:[A-Z][a-z]{2,}\s+)?\d+)?,\s*\d{4})")
 
 
 def parse_fox_date_range(date_text):
     date_text = " ".join(date_text.split())
     date_text = date_text.replace(" - ", "-").replace("- ", "-").replace(" -", "-")
-    date_text = re.sub(r"\s+,", ",", date_text)
-
-    month_map = {
-        "january": "Jan", "february": "Feb", "march": "Mar", "april": "Apr",
-        "may": "May", "june": "Jun", "july": "Jul", "august": "Aug",
-        "september": "Sep", "october": "Oct", "november": "Nov", "december": "Dec",
-    }
-    for full, abbrev in month_map.items():
-        date_text = re.sub(rf"\b{full}\b", abbrev, date_text, flags=re.IGNORECASE)
+    date_text = FOX_SPACE_BEFORE_COMMA_RE.sub(",", date_text)
+    date_text = FOX_FULL_MONTH_RE.sub(lambda m: FOX_MONTH_ABBREVIATIONS[m.group(1).lower()], date_text)
 
-    single_match = re.match(r"^([A-Za-z]+)\s+(\d+),\s*(\d{4})$", date_text)
+    single_match = FOX_SINGLE_DATE_RE.match(date_text)
     if single_match:
         month_str, day, year = single_match.groups()
         try:
@@ -60,7 +73,7 @@ def parse_fox_date_range(date_text):
         except ValueError:
             pass
 
-    same_month = re.match(r"^([A-Za-z]+)\s+(\d+)-(\d+),\s*(\d{4})$", date_text)
+    same_month = FOX_SAME_MONTH_RANGE_RE.match(date_text)
     if same_month:
         month_str, start_day, end_day, year = same_month.groups()
         try:
@@ -70,7 +83,7 @@ def parse_fox_date_range(date_text):
         except ValueError:
             pass
 
-    cross_month = re.match(r"^([A-Za-z]+)\s+(\d+)-([A-Za-z]+)\s+(\d+),\s*(\d{4})$", date_text)
+    cross_month = FOX_CROSS_MONTH_RANGE_RE.match(date_text)
     if cross_month:
         start_month, start_day, end_month, end_day, year = cross_month.groups()
         try:
@@ -89,7 +102,7 @@ def init_fox_session(max_retries=3):
             browser={"browser": "chrome", "platform": "windows", "mobile": False, "desktop": True}
         )
     else:
-        session = requests.Session()
+        session = create_session()
 
     session.headers.update(FOX_THEATRE_AJAX_HEADERS)
 
@@ -123,11 +136,11 @@ def scrape_fox_ajax_all_events():
             return None
 
         if url not in description_cache:
+            FOX_THEATRE_DESCRIPTION_RATE_LIMITER.acquire()
             try:
                 resp = session.get(url, timeout=FOX_THEATRE_TIMEOUT)
                 resp.raise_for_status()
                 description_cache[url] = resp.text
-                time.sleep(random.uniform(0.2, 0.5))
             except Exception as e:
                 print(f"    Fox Theatre description: ERROR - {e}")
                 description_cache[url] = ""
@@ -135,7 +148,7 @@ def scrape_fox_ajax_all_events():
         if not description_cache[url]:
             return None
 
-        detail_soup = BeautifulSoup(description_cache[url], "html.parser")
+        detail_soup = BeautifulSoup(description_cache[url], HTML_PARSER)
         return extract_first_description(
             detail_soup,
             ['meta[name="description"]', 'meta[property="og:description"]'],
@@ -177,19 +190,20 @@ def scrape_fox_ajax_all_events():
             raise last_error or Exception("Failed to fetch Fox Theatre events")
 
         try:
-            html = json.loads(resp.text)
+            html = loads_json(resp.content)
         except json.JSONDecodeError:
             html = resp.text
 
         if not html.strip() or '<div class="eventItem' not in html:
             break
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
         cards = soup.select("div.eventItem")
 
         if not cards:
             break
 
+        page_events = []
         for card in cards:
             title_el = card.select_one("h3.title a, h3.title, .title a")
             if title_el:
@@ -204,9 +218,7 @@ def scrape_fox_ajax_all_events():
             detail_link = card.select_one("h3.title a, a.more, a[href*='/events/detail/']")
             if not detail_link:
                 continue
-            detail_url = detail_link.get("href", "")
-            if not detail_url.startswith("http"):
-                detail_url = FOX_THEATRE_BASE + detail_url
+            detail_url = urljoin(FOX_THEATRE_BASE, detail_link.get("href", ""))
 
             if detail_url in seen_urls:
                 continue
@@ -230,7 +242,7 @@ def scrape_fox_ajax_all_events():
                     date_text = date_div.get_text(strip=True)
             else:
                 card_text = card.get_text()
-                date_match = re.search(r"([A-Z][a-z]{2,}\s+\d+(?:-(?:[A-Z][a-z]{2,}\s+)?\d+)?,\s*\d{4})", card_text)
+                date_match = FOX_CARD_DATE_RE.search(card_text)
                 date_text = date_match.group(1) if date_match else None
 
             if not date_text:
@@ -244,10 +256,10 @@ def scrape_fox_ajax_all_events():
             image_url = None
             if img:
                 image_url = img.get("src") or img.get("data-src")
-                if image_url and not image_url.startswith("http"):
-                    image_url = FOX_THEATRE_BASE + image_url
+                if image_url:
+                    image_url = urljoin(FOX_THEATRE_BASE, image_url)
 
-            ticket_link = card.select_one("a.tickets, a[href*='evenue.net']")
+            ticket_link = first_link(card.find_all("a"), classes=("tickets",), href_contains=("evenue.net",))
             ticket_url = ticket_link.get("href").strip() if ticket_link else detail_url
 
             card_classes = card.get("class", [])
@@ -270,11 +282,19 @@ def scrape_fox_ajax_all_events():
                 "fox_category": fox_category,
             }
 
-            description = fetch_description(detail_url, title)
-            if description:
-                event["description"] = description
+            page_events.append(event)
+
+        # Detail pages are independent, so fetch this page's descriptions concurrently.
+        with ThreadPoolExecutor(max_workers=FOX_THEATRE_DESCRIPTION_WORKERS) as executor:
+            descriptions = executor.map(
+                lambda event: fetch_description(event["info_url"], event["title"]),
+                page_events,
+            )
+            for event, description in zip(page_events, descriptions):
+                if description:
+                    event["description"] = description
 
-            events.append(event)
+        events.extend(page_events)
 
         if len(cards) < per_page:
             break
@@ -310,8 +330,7 @@ def scrape_fox_theatre():
         return events
     except Exception as e:
         try:
-            with open(config.OUTPUT_PATH, "r") as f:
-                cached = json.load(f)
+            cached = read_json(config.OUTPUT_PATH)
             fallback_events = [evt for evt in cached if evt.get("venue") == "Fox Theatre"]
             if fallback_events:
                 print(f"    Fox Theatre: using cached events ({len(fallback_events)}) due to error: {e}")
@@ -8,7 +8,9 @@ from zoneinfo import ZoneInfo
 import requests
 from bs4 import BeautifulSoup
 
+from scraper.pipeline.io import loads_json
 from scraper.utils.descriptions import clean_description
+from scraper.utils.soup import HTML_PARSER
 
 HELIUM_EVENTS_URL = "https://atlanta.heliumcomedy.com/events"
 HELIUM_BASE_URL = "https://atlanta.heliumcomedy.com"
@@ -33,6 +35,11 @@ HELIUM_DESCRIPTION_STOP_MARKERS = (
     "PLEASE NOTE:",
     "Management reserves",
 )
+# Rejoins a heading line split from its sentence ("Name\n\nis a comedian...")
+HELIUM_DESCRIPTION_JOIN_RE = re.compile(
+    r"^([^\n]+)\n\n(?=(?:is|are|was|were|has|have|will|can)\b)",
+    re.IGNORECASE,
+)
 
 
 def scrape_helium_comedy():
@@ -53,7 +60,7 @@ def scrape_helium_comedy():
 
 
 def _extract_jsonld_events(html):
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     events = []
 
     for script in soup.select('script[type="application/ld+json"]'):
@@ -62,7 +69,7 @@ def _extract_jsonld_events(html):
             continue
 
         try:
-            data = json.loads(raw)
+            data = loads_json(str(raw))  # orjson rejects str subclasses like bs4 strings
         except json.JSONDecodeError:
             continue
 
@@ -140,12 +147,7 @@ def _clean_helium_description(value):
             end = min(end, index)
 
     description = description[:end].strip()
-    description = re.sub(
-        r"^([^\n]+)\n\n(?=(?:is|are|was|were|has|have|will|can)\b)",
-        r"\1 ",
-        description,
-        flags=re.IGNORECASE,
-    )
+    description = HELIUM_DESCRIPTION_JOIN_RE.sub(r"\1 ", description)
     return description or None
 
 
@@ -1,10 +1,11 @@
 import itertools
 import os
-import time
-
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
 
+from scraper.pipeline.io import loads_json
 from scraper.utils.dates import normalize_time
+from scraper.utils.http import TokenBucket, create_session
 
 LIVE_NATION_API_KEY = os.environ.get("LIVE_NATION_API_KEY", "da2-jmvb5y2gjfcrrep3wzeumqwgaq")
 LIVE_NATION_GRAPHQL_URL = "https://api.livenation.com/graphql"
@@ -41,7 +42,13 @@ query EVENTS_PAGE($offset: Int!, $venue_id: String!) {
 }
 """
 LIVE_NATION_PAGE_SIZE = 36
+LIVE_NATION_PAGE_WINDOW = 3
 LIVE_NATION_TIMEOUT = (8, 20)
+# Shared by all Live Nation venues (scraped concurrently): bursts of one page
+# window, then ~5 requests/second.
+LIVE_NATION_RATE_LIMITER = TokenBucket(rate=5, capacity=LIVE_NATION_PAGE_WINDOW)
+COMEDY_GENRE_RE = re.compile(r"comedy|comedian|stand-?up")
+BROADWAY_GENRE_RE = re.compile(r"theat(?:re|er)|broadway|musical")
 
 
 def get_category_from_genres(artists):
@@ -51,9 +58,9 @@ def get_category_from_genres(artists):
 
     genre = (artists[0].get("genre") or "").lower()
 
-    if any(kw in genre for kw in ["comedy", "stand-up", "standup", "comedian"]):
+    if COMEDY_GENRE_RE.search(genre):
         return "comedy"
-    if any(kw in genre for kw in ["theatre", "theater", "broadway", "musical"]):
+    if BROADWAY_GENRE_RE.search(genre):
         return "broadway"
 
     return "concerts"
@@ -61,32 +68,37 @@ def get_category_from_genres(artists):
 
 def scrape_live_nation_venue(venue_id, venue_name):
     """Scrape events from a Live Nation venue's GraphQL API."""
-    session = requests.Session()
+    session = create_session()
     session.headers.update(LIVE_NATION_HEADERS)
 
+    def fetch_page(offset):
+        payload = {
+            "query": LIVE_NATION_QUERY,
+            "variables": {"offset": offset, "venue_id": venue_id},
+        }
+        LIVE_NATION_RATE_LIMITER.acquire()
+        resp = session.post(LIVE_NATION_GRAPHQL_URL, json=payload, timeout=LIVE_NATION_TIMEOUT)
+        resp.raise_for_status()
+        data = loads_json(resp.content)
+        if data.get("errors"):
+            raise RuntimeError(f"Live Nation GraphQL errors for {venue_name}: {data['errors']}")
+        return data.get("data", {}).get("getEvents", [])
+
     def pages():
+        # The API doesn't report a total, so request a window of offsets at once
+        # and stop at the first empty or short page.
         offset = 0
-        while True:
-            payload = {
-                "query": LIVE_NATION_QUERY,
-                "variables": {"offset": offset, "venue_id": venue_id},
-            }
-            resp = session.post(LIVE_NATION_GRAPHQL_URL, json=payload, timeout=LIVE_NATION_TIMEOUT)
-            resp.raise_for_status()
-            data = resp.json()
-            if data.get("errors"):
-                raise RuntimeError(f"Live Nation GraphQL errors for {venue_name}: {data['errors']}")
-
-            events = data.get("data", {}).get("getEvents", [])
-            if not events:
-                break
-
-            yield events
-            if len(events) < LIVE_NATION_PAGE_SIZE:
-                break
-
-            offset += LIVE_NATION_PAGE_SIZE
-            time.sleep(0.4)
+        with ThreadPoolExecutor(max_workers=LIVE_NATION_PAGE_WINDOW) as executor:
+            while True:
+                offsets = [offset + i * LIVE_NATION_PAGE_SIZE for i in range(LIVE_NATION_PAGE_WINDOW)]
+                for events in executor.map(fetch_page, offsets):
+                    if not events:
+                        return
+                    yield events
+                    if len(events) < LIVE_NATION_PAGE_SIZE:
+                        return
+
+                offset += LIVE_NATION_PAGE_WINDOW * LIVE_NATION_PAGE_SIZE
 
     def transform_event(event):
         event_date = event.get("event_date")
@@ -1,12 +1,14 @@
 import re
-from datetime import datetime
+from urllib.parse import urljoin
 
-import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from scraper import config
-from scraper.utils.dates import normalize_time
+from scraper.utils.dates import iso_date, normalize_time, parse_month_day_year
 from scraper.utils.descriptions import clean_description
+from scraper.utils.http import create_session
+from scraper.utils.soup import HTML_PARSER, class_strainer, first_link, leaf_text
 
 MASQUERADE_BASE = "https://www.masqueradeatlanta.com"
 MASQUERADE_HEADERS = {
@@ -14,13 +16,32 @@ MASQUERADE_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 MASQUERADE_TIMEOUT = (8, 20)
+# Only event cards are read from the listing page, so skip building the rest
+MASQUERADE_EVENT_STRAINER = class_strainer("event", name="article")
 
 # Masquerade stages (events at other venues should be filtered out)
 MASQUERADE_STAGES = ["Heaven", "Hell", "Purgatory", "Altar"]
+MASQUERADE_STAGE_RE = re.compile("|".join(MASQUERADE_STAGES))
+
+MASQUERADE_DATETIME_RE = re.compile(r"([A-Za-z]+\s+\d{1,2},\s+\d{4})\s+(\d{1,2}:\d{2}\s+[AaPp][Mm])")
+MASQUERADE_NAME_NOISE_RE = re.compile(r"[^a-z0-9]+")
+MASQUERADE_SUPPORT_SPLIT_RE = re.compile(r",\s*|\s+&\s+|\s+and\s+")
+MASQUERADE_SUPPORT_PREFIX_RE = re.compile(r"^(?:&|and)\s+", re.IGNORECASE)
+MASQUERADE_TIME_RE = re.compile(r"(\d{1,2}:\d{2})\s*(am|pm)", re.IGNORECASE)
+MASQUERADE_BACKGROUND_URL_RE = re.compile(r"url\(['\"]?([^'\"]+)['\"]?\)")
+
+# Per-card selectors, compiled once instead of on every select_one call
+MASQUERADE_VENUE_SELECTOR = sv.compile(".js-listVenue")
+MASQUERADE_DATE_SELECTOR = sv.compile(".eventStartDate")
+MASQUERADE_TIME_SELECTOR = sv.compile(".time-show")
+MASQUERADE_TITLE_SELECTOR = sv.compile(".eventHeader__title")
+MASQUERADE_SUPPORT_SELECTOR = sv.compile(".eventHeader__support")
+MASQUERADE_TICKET_LINK_SELECTOR = sv.compile("a.btn-purple, a[itemprop='url']")
+MASQUERADE_IMAGE_SELECTOR = sv.compile(".event--featuredImage")
 
 
 def _normalize_artist_name(value):
-    return re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
+    return MASQUERADE_NAME_NOISE_RE.sub(" ", value.lower()).strip()
 
 
 def _same_artist_name(a, b):
@@ -35,8 +56,8 @@ def split_masquerade_support_acts(support_text):
         return []
 
     support_acts = []
-    for act in re.split(r",\s*|\s+&\s+|\s+and\s+", support_text):
-        act = re.sub(r"^(?:&|and)\s+", "", act.strip(), flags=re.IGNORECASE)
+    for act in MASQUERADE_SUPPORT_SPLIT_RE.split(support_text):
+        act = MASQUERADE_SUPPORT_PREFIX_RE.sub("", act.strip())
         if act:
             support_acts.append(act)
     return support_acts
@@ -47,11 +68,13 @@ def scrape_masquerade():
     Scrape events from The Masquerade using HTML parsing.
     Only includes events at Masquerade stages (Heaven, Hell, Purgatory, Altar).
     """
+    session = create_session()
+    session.headers.update(MASQUERADE_HEADERS)
     url = MASQUERADE_BASE + "/events/"
     try:
-        resp = requests.get(url, headers=MASQUERADE_HEADERS, timeout=MASQUERADE_TIMEOUT)
+        resp = session.get(url, timeout=MASQUERADE_TIMEOUT)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=MASQUERADE_EVENT_STRAINER)
     except Exception as e:
         print(f"    The Masquerade: ERROR - {e}")
         return []
@@ -65,7 +88,7 @@ def scrape_masquerade():
 
         if url not in description_cache:
             try:
-                detail_resp = requests.get(url, headers=MASQUERADE_HEADERS, timeout=MASQUERADE_TIMEOUT)
+                detail_resp = session.get(url, timeout=MASQUERADE_TIMEOUT)
                 detail_resp.raise_for_status()
                 description_cache[url] = detail_resp.text
             except Exception as e:
@@ -75,7 +98,7 @@ def scrape_masquerade():
         if not description_cache[url]:
             return None
 
-        detail_soup = BeautifulSoup(description_cache[url], "html.parser")
+        detail_soup = BeautifulSoup(description_cache[url], HTML_PARSER)
         for bio in detail_soup.select(".attractions .attraction-bio"):
             title_el = bio.select_one(".attraction_title")
             title = title_el.get_text(" ", strip=True) if title_el else headliner
@@ -90,23 +113,18 @@ def scrape_masquerade():
 
     for article in soup.select("article.event"):
         # Check if this is at The Masquerade (not an external venue)
-        venue_span = article.select_one(".js-listVenue")
+        venue_span = MASQUERADE_VENUE_SELECTOR.select_one(article)
         if not venue_span:
             continue
 
-        venue_text = venue_span.get_text(strip=True)
-        stage = None
-        for s in MASQUERADE_STAGES:
-            if s in venue_text:
-                stage = s
-                break
-
         # Skip events not at Masquerade
-        if not stage:
+        stage_match = MASQUERADE_STAGE_RE.search(leaf_text(venue_span))
+        if not stage_match:
             continue
+        stage = stage_match.group()
 
         # Parse date from .eventStartDate content attribute or spans
-        date_el = article.select_one(".eventStartDate")
+        date_el = MASQUERADE_DATE_SELECTOR.select_one(article)
         if not date_el:
             continue
 
@@ -117,12 +135,11 @@ def scrape_masquerade():
 
         if date_content:
             # Format: "November 30, 2025 6:00 pm"
-            try:
-                dt_obj = datetime.strptime(date_content, "%B %d, %Y %I:%M %p")
-                event_date = dt_obj.strftime("%Y-%m-%d")
-                doors_time = dt_obj.strftime("%H:%M")
-            except ValueError:
-                pass
+            match = MASQUERADE_DATETIME_RE.fullmatch(date_content)
+            if match:
+                event_date = parse_month_day_year(match.group(1))
+                if event_date:
+                    doors_time = normalize_time(match.group(2))
 
         # Fallback to spans if content attribute didn't work
         if not event_date:
@@ -131,27 +148,28 @@ def scrape_masquerade():
             year_el = date_el.select_one(".eventStartDate__year")
 
             if month_el and day_el and year_el:
-                try:
-                    date_str = f"{month_el.get_text(strip=True)} {day_el.get_text(strip=True)}, {year_el.get_text(strip=True)}"
-                    dt_obj = datetime.strptime(date_str, "%b %d, %Y")
-                    event_date = dt_obj.strftime("%Y-%m-%d")
-                except ValueError:
+                event_date = iso_date(
+                    leaf_text(year_el),
+                    leaf_text(month_el),
+                    leaf_text(day_el),
+                )
+                if not event_date:
                     continue
             else:
                 continue
 
         # Parse doors time from .time-show if not already extracted
         if not doors_time:
-            time_el = article.select_one(".time-show")
+            time_el = MASQUERADE_TIME_SELECTOR.select_one(article)
             if time_el:
-                time_text = time_el.get_text(strip=True)
+                time_text = leaf_text(time_el)
                 # Extract time from "Doors 7:00 pm / All Ages"
-                time_match = re.search(r"(\d{1,2}:\d{2})\s*(am|pm)", time_text, re.IGNORECASE)
+                time_match = MASQUERADE_TIME_RE.search(time_text)
                 if time_match:
                     doors_time = normalize_time(f"{time_match.group(1)}{time_match.group(2)}")
 
         # Get title (headliner)
-        title_el = article.select_one(".eventHeader__title")
+        title_el = MASQUERADE_TITLE_SELECTOR.select_one(article)
         if not title_el:
             continue
         headliner = title_el.get_text(strip=True)
@@ -159,7 +177,7 @@ def scrape_masquerade():
             continue
 
         # Get supporting acts
-        support_el = article.select_one(".eventHeader__support")
+        support_el = MASQUERADE_SUPPORT_SELECTOR.select_one(article)
         support_text = support_el.get_text(strip=True) if support_el else ""
 
         # Build artists list
@@ -170,29 +188,30 @@ def scrape_masquerade():
                     artists.append({"name": act})
 
         # Get ticket URL
-        ticket_link = article.select_one("a.btn-purple, a[itemprop='url']")
+        links = article.find_all("a")
+        ticket_link = MASQUERADE_TICKET_LINK_SELECTOR.select_one(article)
         ticket_url = ticket_link.get("href", "") if ticket_link else None
 
         if not ticket_url:
             # Try detail page link as fallback
-            detail_link = article.select_one("a.wrapperLink")
+            detail_link = first_link(links, classes=("wrapperLink",))
             ticket_url = detail_link.get("href", "") if detail_link else None
 
         if not ticket_url:
             continue
 
         # Get detail URL
-        detail_link = article.select_one("a.wrapperLink, a[href*='/events/']")
+        detail_link = first_link(links, classes=("wrapperLink",), href_contains=("/events/",))
         detail_url = detail_link.get("href", "") if detail_link else None
-        if detail_url and not detail_url.startswith("http"):
-            detail_url = MASQUERADE_BASE + detail_url
+        if detail_url:
+            detail_url = urljoin(MASQUERADE_BASE, detail_url)
 
         # Get image URL from background-image style
-        image_el = article.select_one(".event--featuredImage")
+        image_el = MASQUERADE_IMAGE_SELECTOR.select_one(article)
         image_url = None
         if image_el:
             style = image_el.get("style", "")
-            img_match = re.search(r"url\(['\"]?([^'\"]+)['\"]?\)", style)
+            img_match = MASQUERADE_BACKGROUND_URL_RE.search(style)
             if img_match:
                 image_url = img_match.group(1)
 
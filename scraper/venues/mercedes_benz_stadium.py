@@ -1,12 +1,14 @@
 import re
-from datetime import datetime
+from urllib.parse import urljoin
 
-import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from scraper.utils.categories import detect_category_from_text, detect_category_from_ticket_url
-from scraper.utils.dates import normalize_time
+from scraper.utils.dates import normalize_time, parse_month_day_year, parse_month_year
 from scraper.utils.descriptions import extract_first_description
+from scraper.utils.http import create_session
+from scraper.utils.soup import HTML_PARSER, class_strainer, first_link, leaf_text
 
 MERCEDES_BENZ_STADIUM_BASE = "https://www.mercedesbenzstadium.com"
 MERCEDES_BENZ_STADIUM_HEADERS = {
@@ -14,6 +16,17 @@ MERCEDES_BENZ_STADIUM_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 MERCEDES_BENZ_STADIUM_TIMEOUT = (8, 20)
+# Only event cards and the team "next home game" blocks are read from the page
+MERCEDES_BENZ_STADIUM_EVENT_STRAINER = class_strainer("events--item", "events_game--item", name="div")
+MERCEDES_BENZ_STADIUM_TIME_RE = re.compile(r"(\d{1,2}:\d{2})\s*(am|pm)", re.IGNORECASE)
+
+# Per-card selectors, compiled once instead of on every select_one call
+MERCEDES_BENZ_STADIUM_TITLE_SELECTOR = sv.compile("h3")
+MERCEDES_BENZ_STADIUM_CATEGORY_SELECTOR = sv.compile("div.events_tags--item.w-dyn-item")
+MERCEDES_BENZ_STADIUM_DETAIL_ITEMS_SELECTOR = sv.compile("div.events_feature_details_dt")
+MERCEDES_BENZ_STADIUM_DETAIL_LINK_SELECTOR = sv.compile("a.btn--3[href*='/events/']")
+MERCEDES_BENZ_STADIUM_TICKET_LINK_SELECTOR = sv.compile("a.btn--1")
+MERCEDES_BENZ_STADIUM_IMAGE_SELECTOR = sv.compile("img.event_image")
 
 MBS_CATEGORY_MAP = {
     "sports": "sports",
@@ -25,11 +38,13 @@ MBS_CATEGORY_MAP = {
 
 
 def scrape_mercedes_benz_stadium():
+    session = create_session()
+    session.headers.update(MERCEDES_BENZ_STADIUM_HEADERS)
     url = MERCEDES_BENZ_STADIUM_BASE + "/events"
     try:
-        resp = requests.get(url, headers=MERCEDES_BENZ_STADIUM_HEADERS, timeout=MERCEDES_BENZ_STADIUM_TIMEOUT)
+        resp = session.get(url, timeout=MERCEDES_BENZ_STADIUM_TIMEOUT)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=MERCEDES_BENZ_STADIUM_EVENT_STRAINER)
     except Exception as e:
         print(f"    Mercedes-Benz Stadium: ERROR - {e}")
         return []
@@ -44,7 +59,7 @@ def scrape_mercedes_benz_stadium():
 
         if url not in description_cache:
             try:
-                detail_resp = requests.get(url, headers=MERCEDES_BENZ_STADIUM_HEADERS, timeout=MERCEDES_BENZ_STADIUM_TIMEOUT)
+                detail_resp = session.get(url, timeout=MERCEDES_BENZ_STADIUM_TIMEOUT)
                 detail_resp.raise_for_status()
                 description_cache[url] = detail_resp.text
             except Exception as e:
@@ -54,7 +69,7 @@ def scrape_mercedes_benz_stadium():
         if not description_cache[url]:
             return None
 
-        detail_soup = BeautifulSoup(description_cache[url], "html.parser")
+        detail_soup = BeautifulSoup(description_cache[url], HTML_PARSER)
         return extract_first_description(
             detail_soup,
             [".event-details-desc.w-richtext", ".event-details-desc"],
@@ -62,48 +77,42 @@ def scrape_mercedes_benz_stadium():
         )
 
     for card in soup.select("div.events--item.w-dyn-item"):
-        title_el = card.select_one("h3")
+        title_el = MERCEDES_BENZ_STADIUM_TITLE_SELECTOR.select_one(card)
         if not title_el:
             continue
         title = title_el.get_text(strip=True)
         if not title:
             continue
 
-        category_el = card.select_one("div.events_tags--item.w-dyn-item")
-        raw_category = category_el.get_text(strip=True).lower() if category_el else "other"
+        category_el = MERCEDES_BENZ_STADIUM_CATEGORY_SELECTOR.select_one(card)
+        raw_category = leaf_text(category_el).lower() if category_el else "other"
         category = MBS_CATEGORY_MAP.get(raw_category, "misc")
 
-        detail_items = card.select("div.events_feature_details_dt")
-        date_str = detail_items[0].get_text(strip=True) if len(detail_items) > 0 else None
-        time_str = detail_items[1].get_text(strip=True) if len(detail_items) > 1 else None
+        detail_items = MERCEDES_BENZ_STADIUM_DETAIL_ITEMS_SELECTOR.select(card)
+        date_str = leaf_text(detail_items[0]) if len(detail_items) > 0 else None
+        time_str = leaf_text(detail_items[1]) if len(detail_items) > 1 else None
 
         event_date = None
         if date_str:
-            for fmt in ["%B %d, %Y", "%B %Y"]:
-                try:
-                    dt_obj = datetime.strptime(date_str, fmt)
-                    event_date = dt_obj.strftime("%Y-%m-%d")
-                    break
-                except ValueError:
-                    continue
+            event_date = parse_month_day_year(date_str) or parse_month_year(date_str)
 
         if not event_date:
             continue
 
         show_time = None
         if time_str and time_str.upper() not in ["TBD", "TBA"]:
-            time_match = re.search(r"(\d{1,2}:\d{2})\s*(AM|PM)", time_str, re.IGNORECASE)
+            time_match = MERCEDES_BENZ_STADIUM_TIME_RE.search(time_str)
             if time_match:
                 show_time = normalize_time(f"{time_match.group(1)}{time_match.group(2)}")
 
-        detail_link = card.select_one("a.btn--3[href*='/events/']")
+        detail_link = MERCEDES_BENZ_STADIUM_DETAIL_LINK_SELECTOR.select_one(card)
         detail_url = None
         if detail_link:
             detail_url = detail_link.get("href", "")
-            if detail_url and not detail_url.startswith("http"):
-                detail_url = MERCEDES_BENZ_STADIUM_BASE + detail_url
+            if detail_url:
+                detail_url = urljoin(MERCEDES_BENZ_STADIUM_BASE, detail_url)
 
-        ticket_link = card.select_one("a.btn--1")
+        ticket_link = MERCEDES_BENZ_STADIUM_TICKET_LINK_SELECTOR.select_one(card)
         ticket_url = ticket_link.get("href", "") if ticket_link else None
         if not ticket_url:
             ticket_url = detail_url
@@ -115,12 +124,12 @@ def scrape_mercedes_benz_stadium():
             continue
         seen_urls.add(key)
 
-        img = card.select_one("img.event_image")
+        img = MERCEDES_BENZ_STADIUM_IMAGE_SELECTOR.select_one(card)
         image_url = None
         if img:
-            image_url = img.get("src") or img.get("data-src")
-            if image_url and not image_url.startswith("http"):
-                image_url = MERCEDES_BENZ_STADIUM_BASE + image_url
+            image_url = img.attrs.get("src") or img.attrs.get("data-src")
+            if image_url:
+                image_url = urljoin(MERCEDES_BENZ_STADIUM_BASE, image_url)
 
         final_category = category
         if category == "misc":
@@ -182,14 +191,8 @@ def scrape_mercedes_benz_stadium():
         team_date = None
         team_time = None
         for part in parts:
-            for fmt in ["%B %d, %Y", "%b %d, %Y"]:
-                try:
-                    dt_obj = datetime.strptime(part, fmt)
-                    team_date = dt_obj.strftime("%Y-%m-%d")
-                    break
-                except ValueError:
-                    pass
-            time_match = re.match(r"(\d{1,2}:\d{2})\s*(am|pm)", part, re.IGNORECASE)
+            team_date = parse_month_day_year(part) or team_date
+            time_match = MERCEDES_BENZ_STADIUM_TIME_RE.match(part)
             if time_match:
                 team_time = normalize_time(f"{time_match.group(1)}{time_match.group(2)}")
 
@@ -200,7 +203,7 @@ def scrape_mercedes_benz_stadium():
         if any(e["date"] == team_date and title in e["artists"][0]["name"] for e in events):
             continue
 
-        ticket_link = team_item.select_one("a[href*='ticketmaster'], a[href*='tickets']")
+        ticket_link = first_link(team_item.find_all("a"), href_contains=("ticketmaster", "tickets"))
         team_ticket_url = ticket_link.get("href") if ticket_link else None
         if not team_ticket_url:
             continue
@@ -1,8 +1,10 @@
 import re
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urljoin
 
-import requests
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from scraper.utils.categories import (
@@ -10,8 +12,10 @@ from scraper.utils.categories import (
     detect_category_from_ticket_url,
     should_override_category,
 )
-from scraper.utils.dates import normalize_time
+from scraper.utils.dates import iso_date, normalize_time
 from scraper.utils.descriptions import extract_first_description
+from scraper.utils.http import create_session
+from scraper.utils.soup import HTML_PARSER, first_link, leaf_text
 
 STATE_FARM_ARENA_BASE = "https://www.statefarmarena.com"
 STATE_FARM_ARENA_HEADERS = {
@@ -19,6 +23,13 @@ STATE_FARM_ARENA_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 STATE_FARM_ARENA_TIMEOUT = (8, 20)
+STATE_FARM_ARENA_TIME_RE = re.compile(r"(\d{1,2}:\d{2})\s*(AM|PM)", re.IGNORECASE)
+
+# Per-card selectors, compiled once instead of on every select_one call
+STATE_FARM_ARENA_TITLE_SELECTOR = sv.compile(".title a, .title")
+STATE_FARM_ARENA_DATE_SELECTOR = sv.compile(".date")
+STATE_FARM_ARENA_META_SELECTOR = sv.compile(".meta")
+STATE_FARM_ARENA_IMAGE_SELECTOR = sv.compile(".thumb img, img")
 
 STATE_FARM_ARENA_CATEGORIES = {
     "/events/category/concerts": "concerts",
@@ -30,8 +41,14 @@ STATE_FARM_ARENA_CATEGORIES = {
 
 def scrape_state_farm_arena():
     """Scrape events from State Farm Arena using HTML parsing."""
+    session = create_session()
+    session.headers.update(STATE_FARM_ARENA_HEADERS)
     all_events = {}
-    description_cache = {}
+    # Detail URL -> Future of its HTML. Categories run concurrently, so the lock
+    # only guards registering a URL; the first caller fetches it outside the
+    # lock and any other category listing the same page waits on the Future.
+    description_futures = {}
+    description_lock = threading.Lock()
 
     def parse_date(date_div):
         if not date_div:
@@ -43,12 +60,9 @@ def scrape_state_farm_arena():
             day = single.select_one(".m-date__day")
             year = single.select_one(".m-date__year")
             if month and day and year:
-                try:
-                    date_str = f"{month.get_text(strip=True)} {day.get_text(strip=True)}, {year.get_text(strip=True)}"
-                    dt = datetime.strptime(date_str, "%b %d, %Y")
-                    return dt.strftime("%Y-%m-%d"), dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    pass
+                date_str = iso_date(leaf_text(year), leaf_text(month), leaf_text(day))
+                if date_str:
+                    return date_str, date_str
 
         range_first = date_div.select_one(".m-date__rangeFirst")
         range_last = date_div.select_one(".m-date__rangeLast")
@@ -57,26 +71,20 @@ def scrape_state_farm_arena():
             day = range_first.select_one(".m-date__day")
             year = range_first.select_one(".m-date__year") or date_div.select_one(".m-date__year")
             if month and day and year:
-                try:
-                    date_str = f"{month.get_text(strip=True)} {day.get_text(strip=True)}, {year.get_text(strip=True)}"
-                    start_dt = datetime.strptime(date_str, "%b %d, %Y")
-                    start_date = start_dt.strftime("%Y-%m-%d")
-
+                start_date = iso_date(leaf_text(year), leaf_text(month), leaf_text(day))
+                if start_date:
                     end_date = start_date
                     if range_last:
                         end_month = range_last.select_one(".m-date__month") or month
                         end_day = range_last.select_one(".m-date__day")
                         end_year = range_last.select_one(".m-date__year") or year
                         if end_day:
-                            try:
-                                end_str = f"{end_month.get_text(strip=True)} {end_day.get_text(strip=True)}, {end_year.get_text(strip=True)}"
-                                end_dt = datetime.strptime(end_str, "%b %d, %Y")
-                                end_date = end_dt.strftime("%Y-%m-%d")
-                            except ValueError:
-                                pass
+                            end_date = iso_date(
+                                leaf_text(end_year),
+                                leaf_text(end_month),
+                                leaf_text(end_day),
+                            ) or start_date
                     return start_date, end_date
-                except ValueError:
-                    pass
 
         return None, None
 
@@ -85,8 +93,8 @@ def scrape_state_farm_arena():
             return None
         time_el = meta_div.select_one(".time")
         if time_el:
-            time_text = time_el.get_text(strip=True)
-            match = re.search(r"(\d{1,2}:\d{2})\s*(AM|PM)", time_text, re.IGNORECASE)
+            time_text = leaf_text(time_el)
+            match = STATE_FARM_ARENA_TIME_RE.search(time_text)
             if match:
                 return normalize_time(f"{match.group(1)}{match.group(2)}")
         return None
@@ -95,64 +103,72 @@ def scrape_state_farm_arena():
         if not url:
             return None
 
-        if url not in description_cache:
+        with description_lock:
+            future = description_futures.get(url)
+            is_owner = future is None
+            if is_owner:
+                future = description_futures[url] = Future()
+
+        if is_owner:
+            html = ""
             try:
-                resp = requests.get(url, headers=STATE_FARM_ARENA_HEADERS, timeout=STATE_FARM_ARENA_TIMEOUT)
+                resp = session.get(url, timeout=STATE_FARM_ARENA_TIMEOUT)
                 resp.raise_for_status()
-                description_cache[url] = resp.text
-                time.sleep(0.2)
+                html = resp.text
             except Exception as e:
                 print(f"    State Farm Arena description: ERROR - {e}")
-                description_cache[url] = ""
+            future.set_result(html)
+            if html:
+                time.sleep(0.2)
 
-        if not description_cache[url]:
+        html = future.result()
+        if not html:
             return None
 
-        detail_soup = BeautifulSoup(description_cache[url], "html.parser")
+        detail_soup = BeautifulSoup(html, HTML_PARSER)
         return extract_first_description(detail_soup, [".event_description"], heading=heading)
 
     def scrape_page(url, category):
-        resp = requests.get(url, headers=STATE_FARM_ARENA_HEADERS, timeout=STATE_FARM_ARENA_TIMEOUT)
+        resp = session.get(url, timeout=STATE_FARM_ARENA_TIMEOUT)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
         events = []
 
         for card in soup.select(".eventItem"):
-            title_el = card.select_one(".title a, .title")
+            title_el = STATE_FARM_ARENA_TITLE_SELECTOR.select_one(card)
             if not title_el:
                 continue
             title = title_el.get_text(strip=True)
             if not title:
                 continue
 
-            detail_link = card.select_one("a.more, a[href*='/events/detail/']")
+            links = card.find_all("a")
+            detail_link = first_link(links, classes=("more",), href_contains=("/events/detail/",))
             if detail_link:
-                detail_url = detail_link.get("href", "")
-                if not detail_url.startswith("http"):
-                    detail_url = STATE_FARM_ARENA_BASE + detail_url
+                detail_url = urljoin(STATE_FARM_ARENA_BASE, detail_link.get("href", ""))
             else:
                 detail_url = None
 
-            ticket_link = card.select_one("a.tickets, a[href*='ticketmaster']")
+            ticket_link = first_link(links, classes=("tickets",), href_contains=("ticketmaster",))
             ticket_url = ticket_link.get("href", "") if ticket_link else detail_url
 
             if not ticket_url:
                 continue
 
-            date_div = card.select_one(".date")
+            date_div = STATE_FARM_ARENA_DATE_SELECTOR.select_one(card)
             start_date, end_date = parse_date(date_div)
             if not start_date:
                 continue
 
-            meta_div = card.select_one(".meta")
+            meta_div = STATE_FARM_ARENA_META_SELECTOR.select_one(card)
             show_time = parse_time(meta_div)
 
-            img = card.select_one(".thumb img, img")
+            img = STATE_FARM_ARENA_IMAGE_SELECTOR.select_one(card)
             image_url = None
             if img:
-                image_url = img.get("src") or img.get("data-src")
-                if image_url and not image_url.startswith("http"):
-                    image_url = STATE_FARM_ARENA_BASE + image_url
+                image_url = img.attrs.get("src") or img.attrs.get("data-src")
+                if image_url:
+                    image_url = urljoin(STATE_FARM_ARENA_BASE, image_url)
 
             final_category = category
             if category == "misc":
@@ -181,40 +197,59 @@ def scrape_state_farm_arena():
         next_url = None
         if load_more:
             next_href = load_more.get("href", "")
-            if next_href and not next_href.startswith("http"):
-                next_url = STATE_FARM_ARENA_BASE + next_href
+            if next_href:
+                next_url = urljoin(STATE_FARM_ARENA_BASE, next_href)
 
         return events, next_url
 
-    for path, category in STATE_FARM_ARENA_CATEGORIES.items():
-        try:
-            url = STATE_FARM_ARENA_BASE + path
-            page_count = 0
-            pages_scraped = 0
-            max_pages = 10
+    def scrape_category(path, category):
+        """Page through one category; returns (events, pages_scraped, error)."""
+        url = STATE_FARM_ARENA_BASE + path
+        category_events = []
+        pages_scraped = 0
+        max_pages = 10
 
+        try:
             while url and pages_scraped < max_pages:
                 page_events, next_url = scrape_page(url, category)
                 pages_scraped += 1
-
-                for event in page_events:
-                    key = event["detail_url"] or event["ticket_url"]
-
-                    if key in all_events:
-                        existing = all_events[key]
-                        if should_override_category(existing["category"], event["category"]):
-                            all_events[key]["category"] = event["category"]
-                    else:
-                        all_events[key] = event
-                        page_count += 1
+                category_events.extend(page_events)
 
                 url = next_url
                 if url:
                     time.sleep(0.3)
+        except Exception as e:
+            return category_events, pages_scraped, e
+
+        return category_events, pages_scraped, None
+
+    # Categories are independent listings, so page through them concurrently.
+    # Results are merged in category order to keep dedupe priority deterministic.
+    with ThreadPoolExecutor(max_workers=len(STATE_FARM_ARENA_CATEGORIES)) as executor:
+        futures = {
+            path: executor.submit(scrape_category, path, category)
+            for path, category in STATE_FARM_ARENA_CATEGORIES.items()
+        }
+
+    for path, future in futures.items():
+        category_events, pages_scraped, error = future.result()
+        page_count = 0
 
+        for event in category_events:
+            key = event["detail_url"] or event["ticket_url"]
+
+            if key in all_events:
+                existing = all_events[key]
+                if should_override_category(existing["category"], event["category"]):
+                    all_events[key]["category"] = event["category"]
+            else:
+                all_events[key] = event
+                page_count += 1
+
+        if error:
+            print(f"    State Farm Arena {path}: ERROR - {error}")
+        else:
             print(f"    State Farm Arena {path}: {page_count} events ({pages_scraped} pages)")
-        except Exception as e:
-            print(f"    State Farm Arena {path}: ERROR - {e}")
 
     events = []
     for source_event in all_events.values():
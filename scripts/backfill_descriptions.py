@@ -19,6 +19,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from scraper import config  # noqa: E402
 from scraper.utils.descriptions import clean_description, extract_first_description  # noqa: E402
+from scraper.utils.soup import HTML_PARSER  # noqa: E402
 
 
 DEFAULT_EVENTS_PATH = REPO_ROOT / "atl-gigs" / "public" / "events" / "events.json"
@@ -289,13 +290,13 @@ def source_for_info_url(url):
 
 def fetch_html_description(url, selectors, heading, session, html_cache, delay):
     html = fetch_html(url, session, html_cache, delay)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
     return extract_first_description(soup, selectors, heading=heading)
 
 
 def fetch_masquerade_description(url, heading, session, html_cache, delay):
     html = fetch_html(url, session, html_cache, delay)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     for bio in soup.select(".attractions .attraction-bio"):
         title_el = bio.select_one(".attraction_title")
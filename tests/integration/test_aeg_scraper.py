@@ -46,10 +46,27 @@ def test_transform_aeg_event_skips_invalid_required_fields():
 
     assert transform_aeg_event({**valid_base, "eventDateTime": "TBD"}, "AEG Venue") is None
     assert transform_aeg_event({**valid_base, "eventDateTime": "not-a-date"}, "AEG Venue") is None
+    assert transform_aeg_event({**valid_base, "eventDateTime": "2026-13-40T20:00:00"}, "AEG Venue") is None
+    assert transform_aeg_event({**valid_base, "eventDateTime": "2026-05-02T25:61:00"}, "AEG Venue") is None
     assert transform_aeg_event({**valid_base, "title": {}}, "AEG Venue") is None
     assert transform_aeg_event({**valid_base, "ticketing": {}}, "AEG Venue") is None
 
 
+def test_transform_aeg_event_accepts_space_separated_datetime():
+    event = {
+        "eventDateTime": "2026-05-01 20:00:00",
+        "doorDateTime": "2026-05-01 19:30:00",
+        "title": {"headlinersText": "Headliner"},
+        "ticketing": {"url": "https://tickets.example.com/headliner"},
+    }
+
+    transformed = transform_aeg_event(event, "AEG Venue")
+
+    assert transformed["date"] == "2026-05-01"
+    assert transformed["show_time"] == "20:00"
+    assert transformed["doors_time"] == "19:30"
+
+
 def test_scrape_aeg_venue_skips_bad_events_without_aborting():
     url = "https://example.com/aeg/events.json"
 
@@ -78,3 +95,78 @@ def test_scrape_aeg_venue_skips_bad_events_without_aborting():
 
     assert len(events) == 1
     assert events[0]["artists"] == [{"name": "Good Event"}]
+
+
+def test_scrape_aeg_venue_reuses_cached_events_on_not_modified(monkeypatch):
+    monkeypatch.setattr("scraper.venues.aeg._aeg_response_cache", {})
+    monkeypatch.setattr("scraper.venues.aeg._aeg_cache_loaded", True)
+    url = "https://example.com/aeg/cached-events.json"
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.GET,
+            url,
+            json={
+                "events": [
+                    {
+                        "eventDateTime": "2026-05-02T20:00:00",
+                        "title": {"headlinersText": "Cached Event"},
+                        "ticketing": {"url": "https://tickets.example.com/cached"},
+                    },
+                ]
+            },
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        rsps.add(
+            rsps.GET,
+            url,
+            status=304,
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+
+        first = scrape_aeg_venue(url, "AEG Venue")
+        first[0]["price"] = "mutated downstream"
+        second = scrape_aeg_venue(url, "AEG Venue")
+
+    assert second[0]["artists"] == [{"name": "Cached Event"}]
+    assert second[0]["price"] is None
+
+
+def test_scrape_aeg_venue_ignores_cache_entries_from_other_versions(monkeypatch):
+    url = "https://example.com/aeg/stale-events.json"
+    monkeypatch.setattr(
+        "scraper.venues.aeg._aeg_response_cache",
+        {
+            url: {
+                "version": "stale",
+                "etag": '"v1"',
+                "last_modified": None,
+                "events": [{"artists": [{"name": "Stale Event"}]}],
+            }
+        },
+    )
+    monkeypatch.setattr("scraper.venues.aeg._aeg_cache_loaded", True)
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            rsps.GET,
+            url,
+            json={
+                "events": [
+                    {
+                        "eventDateTime": "2026-05-02T20:00:00",
+                        "title": {"headlinersText": "Fresh Event"},
+                        "ticketing": {"url": "https://tickets.example.com/fresh"},
+                    },
+                ]
+            },
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+
+        events = scrape_aeg_venue(url, "AEG Venue")
+
+        assert "If-None-Match" not in rsps.calls[0].request.headers
+
+    assert events[0]["artists"] == [{"name": "Fresh Event"}]
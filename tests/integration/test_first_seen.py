@@ -13,3 +13,24 @@ def test_update_first_seen_marks_new_events():
     assert new_count == 2
     assert updated[0]["first_seen"]
     assert seen_cache["events"]["event-1"]["first_seen"]
+
+
+def test_update_first_seen_uses_run_timestamp_for_is_new():
+    events = [
+        {"slug": "fresh"},
+        {"slug": "stale"},
+        {"slug": "also-stale"},
+    ]
+    seen_cache = {
+        "events": {
+            "stale": {"first_seen": "2025-01-01T00:00:00Z"},
+            "also-stale": {"first_seen": "2025-01-01T00:00:00Z"},
+        },
+        "last_updated": None,
+    }
+
+    updated, new_count = update_first_seen(events, seen_cache, now_iso="2026-03-01T12:00:00Z")
+
+    assert new_count == 1
+    assert updated[0]["first_seen"] == "2026-03-01T12:00:00Z"
+    assert [event["is_new"] for event in updated] == [True, False, False]
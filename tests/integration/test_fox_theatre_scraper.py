@@ -0,0 +1,58 @@
+import json
+
+import pytest
+import requests
+
+responses = pytest.importorskip("responses")
+
+from scraper.utils.http import TokenBucket
+from scraper.venues import fox
+from scraper.venues.fox import FOX_THEATRE_BASE, scrape_fox_ajax_all_events
+
+
+def _event_card(title, detail_path):
+    return f"""
+    <div class="eventItem concerts">
+      <h3 class="title"><a href="{detail_path}">{title}</a></h3>
+      <div class="date">
+        <span class="m-date__month">May</span>
+        <span class="m-date__day">2</span>
+        <span class="m-date__year">, 2026</span>
+      </div>
+    </div>
+    """
+
+
+def _detail_page(description):
+    return f'<html><head><meta name="description" content="{description}"></head></html>'
+
+
+def test_scrape_fox_ajax_keeps_description_order_and_survives_detail_406(monkeypatch):
+    monkeypatch.setattr(fox, "init_fox_session", requests.Session)
+    monkeypatch.setattr(fox, "FOX_THEATRE_DESCRIPTION_RATE_LIMITER", TokenBucket(rate=1000, capacity=1000))
+    monkeypatch.setattr(fox.time, "sleep", lambda seconds: None)
+
+    titles = [f"Show {i}" for i in range(6)]
+    cards = "".join(_event_card(title, f"/events/detail/show-{i}") for i, title in enumerate(titles))
+    ajax_url = (
+        f"{FOX_THEATRE_BASE}/events/events_ajax/0?category=0&venue=0&team=0&exclude="
+        "&per_page=60&came_from_page=event-list-page"
+    )
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(rsps.GET, ajax_url, body=json.dumps(cards), status=200)
+        for i in range(len(titles)):
+            detail_url = f"{FOX_THEATRE_BASE}/events/detail/show-{i}"
+            if i == 3:
+                rsps.add(rsps.GET, detail_url, status=406)
+            else:
+                rsps.add(rsps.GET, detail_url, body=_detail_page(f"A vivid night of songs from artist {i}."), status=200)
+
+        events = scrape_fox_ajax_all_events()
+
+    assert [event["title"] for event in events] == titles
+    for i, event in enumerate(events):
+        if i == 3:
+            assert "description" not in event
+        else:
+            assert event["description"] == f"A vivid night of songs from artist {i}."
@@ -1,12 +1,18 @@
+import json
+
 import pytest
 
 responses = pytest.importorskip("responses")
 
-from scraper.venues.live_nation import LIVE_NATION_GRAPHQL_URL, scrape_live_nation_venue
+from scraper.venues.live_nation import (
+    LIVE_NATION_GRAPHQL_URL,
+    get_category_from_genres,
+    scrape_live_nation_venue,
+)
 
 
 def test_scrape_live_nation_maps_event_time_to_show_time(monkeypatch):
-    monkeypatch.setattr("scraper.venues.live_nation.time.sleep", lambda *_: None)
+    monkeypatch.setattr("scraper.utils.http.time.sleep", lambda *_: None)
 
     with responses.RequestsMock() as rsps:
         rsps.add(
@@ -47,7 +53,7 @@ def test_scrape_live_nation_maps_event_time_to_show_time(monkeypatch):
 
 
 def test_scrape_live_nation_raises_graphql_errors(monkeypatch):
-    monkeypatch.setattr("scraper.venues.live_nation.time.sleep", lambda *_: None)
+    monkeypatch.setattr("scraper.utils.http.time.sleep", lambda *_: None)
 
     with responses.RequestsMock() as rsps:
         rsps.add(
@@ -62,7 +68,7 @@ def test_scrape_live_nation_raises_graphql_errors(monkeypatch):
 
 
 def test_scrape_live_nation_filters_events_missing_required_fields(monkeypatch):
-    monkeypatch.setattr("scraper.venues.live_nation.time.sleep", lambda *_: None)
+    monkeypatch.setattr("scraper.utils.http.time.sleep", lambda *_: None)
 
     with responses.RequestsMock() as rsps:
         rsps.add(
@@ -99,3 +105,40 @@ def test_scrape_live_nation_filters_events_missing_required_fields(monkeypatch):
 
     assert len(events) == 1
     assert events[0]["artists"] == [{"name": "Fallback Artist"}]
+
+
+def test_scrape_live_nation_fetches_pages_in_windows_and_keeps_order(monkeypatch):
+    monkeypatch.setattr("scraper.utils.http.time.sleep", lambda *_: None)
+    monkeypatch.setattr("scraper.venues.live_nation.LIVE_NATION_PAGE_SIZE", 2)
+    monkeypatch.setattr("scraper.venues.live_nation.LIVE_NATION_PAGE_WINDOW", 2)
+
+    def page_callback(request):
+        offset = json.loads(request.body)["variables"]["offset"]
+        count = {0: 2, 2: 2, 4: 1}.get(offset, 0)
+        events = [
+            {
+                "artists": [{"name": f"Artist {offset + i}"}],
+                "event_date": "2026-05-05",
+                "event_time": "20:00:00",
+                "name": f"Artist {offset + i}",
+                "url": f"https://tickets.example.com/{offset + i}",
+                "images": [],
+            }
+            for i in range(count)
+        ]
+        return 200, {}, json.dumps({"data": {"getEvents": events}})
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add_callback(rsps.POST, LIVE_NATION_GRAPHQL_URL, callback=page_callback)
+
+        events = scrape_live_nation_venue("venue-id", "Test Live Nation Venue")
+
+    assert [e["artists"][0]["name"] for e in events] == [f"Artist {i}" for i in range(5)]
+
+
+def test_get_category_from_genres_uses_headliner_genre():
+    assert get_category_from_genres([{"name": "A", "genre": "Stand-Up Comedy"}]) == "comedy"
+    assert get_category_from_genres([{"name": "A", "genre": "Musical Comedy"}]) == "comedy"
+    assert get_category_from_genres([{"name": "A", "genre": "Theater"}]) == "broadway"
+    assert get_category_from_genres([{"name": "A", "genre": "Rock"}, {"name": "B", "genre": "Comedy"}]) == "concerts"
+    assert get_category_from_genres([]) == "concerts"
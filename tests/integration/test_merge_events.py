@@ -20,3 +20,38 @@ def test_merge_events_preserves_existing_first_seen():
     assert merged[0]["first_seen"] == "2025-01-01T00:00:00Z"
     assert merged[0]["is_new"] is False
     assert merged[0]["description"] == "Existing artist biography."
+
+
+def test_merge_events_returns_events_sorted_by_date():
+    existing = [
+        {"ticket_url": "https://tickets/a", "date": "2026-01-01"},
+        {"ticket_url": "https://tickets/b", "date": "2026-01-05"},
+        {"ticket_url": "https://tickets/c", "date": "2026-01-09"},
+    ]
+    new = [
+        {"ticket_url": "https://tickets/d", "date": "2026-01-07"},
+        {"ticket_url": "https://tickets/b", "date": "2026-01-10"},
+        {"ticket_url": "https://tickets/e", "date": "2026-01-02"},
+    ]
+
+    merged = merge_events(existing, new)
+
+    assert [e["ticket_url"].rsplit("/", 1)[-1] for e in merged] == ["a", "e", "d", "c", "b"]
+
+
+def test_merge_events_orders_same_date_events_by_time_then_slug():
+    existing = [
+        {"ticket_url": "https://tickets/late", "date": "2026-01-01", "show_time": "21:00", "slug": "late"},
+        {"ticket_url": "https://tickets/b-early", "date": "2026-01-01", "show_time": "19:00", "slug": "b-early"},
+    ]
+    new = [
+        {"ticket_url": "https://tickets/a-early", "date": "2026-01-01", "show_time": "19:00", "slug": "a-early"},
+        {"ticket_url": "https://tickets/untimed", "date": "2026-01-01", "show_time": None, "slug": "untimed"},
+    ]
+
+    merged = merge_events(existing, new)
+    merged_reversed = merge_events(list(reversed(existing)), list(reversed(new)))
+
+    expected = ["untimed", "a-early", "b-early", "late"]
+    assert [e["slug"] for e in merged] == expected
+    assert [e["slug"] for e in merged_reversed] == expected
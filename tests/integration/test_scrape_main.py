@@ -0,0 +1,77 @@
+import time
+
+import scrape
+from scraper import config
+
+
+def _event(venue, artist, ticket_url, date="2026-05-02"):
+    return {
+        "venue": venue,
+        "date": date,
+        "artists": [{"name": artist}],
+        "ticket_url": ticket_url,
+        "category": "concerts",
+    }
+
+
+def test_main_collects_venues_in_registry_order_and_dedupes_slugs(monkeypatch, tmp_path):
+    def slow_venue():
+        # Finishes after the failing venue, so results must still follow registry order
+        time.sleep(0.05)
+        return [
+            _event("Slow Venue", "Same Artist", "https://tickets.example.com/early"),
+            _event("Slow Venue", "Same Artist", "https://tickets.example.com/late"),
+            _event("Slow Venue", "", "https://tickets.example.com/invalid"),
+        ]
+
+    def broken_venue():
+        raise RuntimeError("listing unavailable")
+
+    written = {}
+    log_lines = []
+
+    monkeypatch.setattr(config, "TM_API_KEY", None)
+    monkeypatch.setattr(config, "SCRAPE_MAX_WORKERS", 2)
+    monkeypatch.setattr(config, "EVENTS_DIR", tmp_path)
+    monkeypatch.setattr(scrape, "get_scrapers", lambda: {"Slow Venue": slow_venue, "Broken Venue": broken_venue})
+    monkeypatch.setattr(scrape, "load_existing_status", lambda: {})
+    monkeypatch.setattr(scrape, "load_existing_events", lambda: [])
+    monkeypatch.setattr(scrape, "load_seen_cache", lambda: {"events": {}})
+    monkeypatch.setattr(scrape, "save_seen_cache", lambda cache: None)
+    monkeypatch.setattr(scrape, "save_aeg_cache", lambda: None)
+    monkeypatch.setattr(scrape, "upload_to_r2", lambda log_func=None: False)
+    monkeypatch.setattr(scrape, "write_json", lambda path, data: written.__setitem__(path, data))
+    monkeypatch.setattr(
+        scrape,
+        "append_run_log",
+        lambda path, lines, retention_days=14: log_lines.extend(lines),
+    )
+    monkeypatch.setattr(
+        scrape.spotify_enrichment,
+        "enrich_events_with_spotify",
+        lambda events, run_timestamp=None, log_func=None: events,
+    )
+    monkeypatch.setattr(scrape.spotify_enrichment, "save_spotify_cache", lambda: None)
+
+    scrape.main()
+
+    status = written[config.STATUS_PATH]
+    assert list(status["venues"]) == ["Slow Venue", "Broken Venue"]
+    assert status["venues"]["Slow Venue"]["success"] is True
+    assert status["venues"]["Slow Venue"]["event_count"] == 3
+    assert status["venues"]["Broken Venue"]["success"] is False
+    assert status["venues"]["Broken Venue"]["error"] == "listing unavailable"
+    assert "RuntimeError" in status["venues"]["Broken Venue"]["error_trace"]
+    assert status["any_success"] is True
+    assert status["all_success"] is False
+
+    messages = [line.split("] ", 2)[2] for line in log_lines]
+    assert messages.index("Scraping Slow Venue...") < messages.index("Scraping Broken Venue...")
+
+    events = written[config.OUTPUT_PATH]
+    slugs_by_ticket = {event["ticket_url"]: event["slug"] for event in events}
+    assert slugs_by_ticket == {
+        "https://tickets.example.com/early": "2026-05-02-slow-venue-same-artist",
+        "https://tickets.example.com/late": "2026-05-02-slow-venue-same-artist-1",
+    }
+    assert all(event["last_seen"] == status["last_run"] for event in events)
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 responses = pytest.importorskip("responses")
@@ -41,3 +43,73 @@ def test_scrape_state_farm_arena_uses_detected_category_for_dedupe_priority():
     assert events[0]["show_time"] == "19:00"
     assert events[0]["info_url"] == f"{STATE_FARM_ARENA_BASE}{detail_path}"
     assert events[0]["image_url"] == f"{STATE_FARM_ARENA_BASE}/images/event.jpg"
+
+
+def test_scrape_state_farm_arena_merges_concurrent_categories_in_category_order():
+    shared_path = "/events/detail/shared-show"
+    listings = {
+        "/events/category/concerts": [("Concert Show", "/events/detail/concert-show"), ("Shared Show", shared_path)],
+        "/events/category/family-shows": [("Family Show", "/events/detail/family-show")],
+        "/events/category/hawks": [("Hawks Game", "/events/detail/hawks-game"), ("Shared Show", shared_path)],
+        "/events/category/other": [],
+    }
+
+    with responses.RequestsMock() as rsps:
+        for path, cards in listings.items():
+            body = "".join(
+                _event_card(title, detail_path, f"https://www.ticketmaster.com{detail_path}")
+                for title, detail_path in cards
+            )
+            rsps.add(rsps.GET, STATE_FARM_ARENA_BASE + path, body=f"<html><body>{body}</body></html>", status=200)
+        for cards in listings.values():
+            for title, detail_path in cards:
+                if detail_path != shared_path:
+                    rsps.add(rsps.GET, STATE_FARM_ARENA_BASE + detail_path, body="<html></html>", status=200)
+        rsps.add(
+            rsps.GET,
+            STATE_FARM_ARENA_BASE + shared_path,
+            body='<div class="event_description"><p>A vivid night of songs from a touring band.</p></div>',
+            status=200,
+        )
+
+        events = scrape_state_farm_arena()
+
+        shared_calls = [call for call in rsps.calls if call.request.url.endswith(shared_path)]
+
+    assert [event["artists"][0]["name"] for event in events] == [
+        "Concert Show",
+        "Shared Show",
+        "Family Show",
+        "Hawks Game",
+    ]
+    assert [event["category"] for event in events] == ["concerts", "sports", "misc", "sports"]
+    assert events[1]["description"] == "A vivid night of songs from a touring band."
+    assert len(shared_calls) == 1
+
+
+def test_scrape_state_farm_arena_fetches_descriptions_for_different_categories_in_parallel():
+    listings = {
+        "/events/category/concerts": ("Concert Show", "/events/detail/concert-show"),
+        "/events/category/hawks": ("Hawks Game", "/events/detail/hawks-game"),
+    }
+    # Each detail response blocks until the other has started, so the scrape
+    # only gets both descriptions if the two fetches overlap.
+    both_fetching = threading.Barrier(2, timeout=5)
+
+    def detail_callback(request):
+        both_fetching.wait()
+        return 200, {}, '<div class="event_description"><p>A vivid night of live music.</p></div>'
+
+    with responses.RequestsMock() as rsps:
+        for path in STATE_FARM_ARENA_CATEGORIES:
+            body = ""
+            if path in listings:
+                title, detail_path = listings[path]
+                body = _event_card(title, detail_path, f"https://www.ticketmaster.com{detail_path}")
+                rsps.add_callback(rsps.GET, STATE_FARM_ARENA_BASE + detail_path, callback=detail_callback)
+            rsps.add(rsps.GET, STATE_FARM_ARENA_BASE + path, body=f"<html><body>{body}</body></html>", status=200)
+
+        events = scrape_state_farm_arena()
+
+    assert [event["artists"][0]["name"] for event in events] == ["Concert Show", "Hawks Game"]
+    assert [event.get("description") for event in events] == ["A vivid night of live music."] * 2
@@ -3,7 +3,7 @@ import pytest
 responses = pytest.importorskip("responses")
 
 from scraper import config
-from scraper.tm import scrape_tm_venue
+from scraper.tm import scrape_tm_stages, scrape_tm_venue
 
 
 def test_scrape_tm_venue_parses_events_and_filters_invalid(monkeypatch):
@@ -72,3 +72,15 @@ def test_scrape_tm_venue_parses_events_and_filters_invalid(monkeypatch):
             "stage": "Main",
         }
     ]
+
+
+def test_scrape_tm_stages_keeps_stage_order(monkeypatch):
+    monkeypatch.setattr(
+        "scraper.tm.scrape_tm_venue",
+        lambda venue_id, venue_name, stage=None: [{"venue": venue_name, "stage": stage, "id": venue_id}],
+    )
+
+    events = scrape_tm_stages("The Masquerade", [("Heaven", "a"), ("Hell", "b"), ("Altar", "c")])
+
+    assert [(event["stage"], event["id"]) for event in events] == [("Heaven", "a"), ("Hell", "b"), ("Altar", "c")]
+    assert {event["venue"] for event in events} == {"The Masquerade"}
@@ -15,3 +15,7 @@ def test_parse_fox_date_range_spaced_comma_markup():
 
 def test_parse_fox_date_range_cross_month_range():
     assert parse_fox_date_range("Jan 27-Feb 1, 2026") == ("2026-01-27", "2026-02-01")
+
+
+def test_parse_fox_date_range_full_month_names():
+    assert parse_fox_date_range("January 27 - February 1, 2026") == ("2026-01-27", "2026-02-01")
@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from scraper.pipeline import io
+
+
+def test_write_json_round_trips_with_and_without_orjson(tmp_path, monkeypatch):
+    data = [{"venue": "The Earl", "artists": [{"name": "Beyoncé"}], "price": None}]
+
+    fast_path = tmp_path / "fast.json"
+    io.write_json(fast_path, data)
+    assert json.loads(fast_path.read_text()) == data
+
+    monkeypatch.setattr(io, "orjson", None)
+    fallback_path = tmp_path / "fallback.json"
+    io.write_json(fallback_path, data)
+    assert json.loads(fallback_path.read_text()) == data
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["fallback.json", "fast.json"]
+
+
+def test_append_run_log_appends_and_compacts_when_large(tmp_path, monkeypatch):
+    log_path = tmp_path / "scrape-log.txt"
+    log_path.write_text("[2099-01-01 00:00:00] [INFO] first run\n")
+    trims = []
+    trim_log_by_time = io.trim_log_by_time
+
+    def recording_trim(path, retention_days=14):
+        trims.append(path)
+        return trim_log_by_time(path, retention_days=retention_days)
+
+    monkeypatch.setattr(io, "trim_log_by_time", recording_trim)
+
+    io.append_run_log(log_path, ["[2099-01-02 00:00:00] [INFO] second run"])
+    assert trims == []
+    assert log_path.read_text().startswith("[2099-01-01 00:00:00] [INFO] first run\n")
+
+    io.append_run_log(log_path, ["[2099-01-03 00:00:00] [INFO] third run"], compact_bytes=0)
+    content = log_path.read_text()
+    assert len(trims) == 1
+    assert "first run" in content
+    assert "second run" in content
+    assert content.endswith("third run\n")
+
+
+def test_append_run_log_does_not_rewrite_log_just_past_retention(tmp_path, monkeypatch):
+    log_path = tmp_path / "scrape-log.txt"
+    just_expired = (datetime.utcnow() - timedelta(days=15)).strftime("%Y-%m-%d %H:%M:%S")
+    log_path.write_text(f"[{just_expired}] [INFO] previous window\n")
+    monkeypatch.setattr(io, "trim_log_by_time", lambda *args, **kwargs: pytest.fail("log was rewritten"))
+
+    io.append_run_log(log_path, ["[2099-01-02 00:00:00] [INFO] new run"], retention_days=14)
+
+    content = log_path.read_text()
+    assert content.startswith(f"[{just_expired}] [INFO] previous window\n")
+    assert content.endswith("new run\n")
+
+
+def test_append_run_log_trims_entries_past_retention_below_compact_size(tmp_path):
+    log_path = tmp_path / "scrape-log.txt"
+    log_path.write_text(
+        "[2000-01-01 00:00:00] [INFO] ancient entry\n"
+        "[2099-01-01 00:00:00] [INFO] recent entry\n"
+    )
+
+    io.append_run_log(log_path, ["[2099-01-02 00:00:00] [INFO] new run"], retention_days=14)
+
+    content = log_path.read_text()
+    assert "ancient entry" not in content
+    assert content.startswith("[2099-01-01 00:00:00] [INFO] recent entry\n")
+    assert content.endswith("new run\n")
+
+
+def test_load_existing_status_reads_bytes_and_handles_bad_json(tmp_path, monkeypatch):
+    status_path = tmp_path / "scrape-status.json"
+    monkeypatch.setattr(io.config, "STATUS_PATH", status_path)
+    monkeypatch.setattr(io, "download_from_r2", lambda *_: False)
+
+    io.write_json(status_path, {"venues": {"The Earl": {"success": True}}})
+    assert io.load_existing_status() == {"venues": {"The Earl": {"success": True}}}
+
+    status_path.write_text("{not json")
+    assert io.load_existing_status() == {"venues": {}}
+
+
+def test_read_json_memory_maps_large_files(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    path = tmp_path / "events.json"
+    data = [{"slug": f"event-{i}", "venue": "The Earl"} for i in range(50)]
+    path.write_text(json.dumps(data))
+
+    assert io.read_json(path) == data
+    monkeypatch.setattr(io, "JSON_MMAP_MIN_BYTES", 1)
+    assert io.read_json(path) == data
@@ -200,7 +200,7 @@ def test_enrichment_skips_current_negative_cache(monkeypatch):
 def test_spotify_search_artist_handles_request_timeout(monkeypatch):
     monkeypatch.setattr(spotify_enrichment, "get_spotify_token", lambda: "token")
     monkeypatch.setattr(
-        spotify_enrichment.requests,
+        spotify_enrichment.SPOTIFY_SESSION,
         "get",
         lambda *_args, **_kwargs: (_ for _ in ()).throw(requests.exceptions.ReadTimeout()),
     )
@@ -1,4 +1,5 @@
 import pytest
+from bs4 import BeautifulSoup
 
 from scraper.pipeline.validate import validate_event
 from scraper.tm import TM_CATEGORY_MAP
@@ -8,8 +9,10 @@ from scraper.utils.categories import (
     map_tm_classification,
     should_override_category,
 )
-from scraper.utils.dates import normalize_time
+from scraper.utils.dates import iso_date, normalize_time, parse_month_day_year, parse_month_year
 from scraper.utils.events import generate_slug, is_zero_price, normalize_price
+from scraper.utils.http import TokenBucket
+from scraper.utils.soup import HTML_PARSER, first_link, leaf_text
 from scraper.spotify_enrichment import (
     normalize_artist_name,
     normalize_spotify_url,
@@ -27,6 +30,19 @@ def test_normalize_time():
     assert normalize_time("8:00 pm doors") == "20:00"
     assert normalize_time("8:30pm show") == "20:30"
     assert normalize_time("bad") is None
+    assert normalize_time("7:30 P.M.") == "19:30"
+    assert normalize_time("19:00") == "19:00"
+
+
+def test_month_name_date_parsing():
+    assert iso_date("2026", "Feb", "7") == "2026-02-07"
+    assert iso_date("2026", "February", "07") == "2026-02-07"
+    assert iso_date("2026", "Feb", "30") is None
+    assert iso_date("2026", "Foo", "1") is None
+    assert parse_month_day_year("May 9, 2026") == "2026-05-09"
+    assert parse_month_day_year("Dec 31, 2026") == "2026-12-31"
+    assert parse_month_day_year("May 9 2026") is None
+    assert parse_month_year("June 2026") == "2026-06-01"
 
 
 def test_normalize_price_adv_dos():
@@ -40,6 +56,8 @@ def test_normalize_price_zero_free():
     result = normalize_price(event)
     assert result["price"] == "See website"
     assert is_zero_price("$0.00") is True
+    assert is_zero_price("$0 - $0.00") is True
+    assert is_zero_price("$0 - $25") is False
 
 
 def test_generate_slug_includes_stage_and_sanitizes():
@@ -133,3 +151,44 @@ def test_spotify_helpers():
     assert is_non_artist_name("tba") is True
     assert extract_spotify_artist_id("https://open.spotify.com/artist/ABC123") == "ABC123"
     assert normalize_spotify_url("spotify:artist:XYZ") == "https://open.spotify.com/artist/XYZ"
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+    monkeypatch.setattr("scraper.utils.http.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("scraper.utils.http.time.sleep", sleeps.append)
+
+    bucket = TokenBucket(rate=5, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+
+    bucket.acquire()
+    assert sleeps == [pytest.approx(0.2)]
+
+    clock["now"] += 10
+    bucket.acquire()
+    assert len(sleeps) == 1
+
+
+def test_first_link_matches_class_or_href_in_document_order():
+    card = BeautifulSoup(
+        '<div><a href="/info">Info</a><a href="https://www.ticketmaster.com/x">Buy</a>'
+        '<a class="btn tickets" href="/t">Tickets</a></div>',
+        HTML_PARSER,
+    )
+    links = card.find_all("a")
+    assert first_link(links, classes=("tickets",), href_contains=("ticketmaster",))["href"] == "https://www.ticketmaster.com/x"
+    assert first_link(links, classes=("tickets",))["href"] == "/t"
+    assert first_link(links, href_contains=("/missing",)) is None
+
+
+def test_leaf_text_matches_get_text_strip():
+    card = BeautifulSoup(
+        '<div><span class="m"> Oct </span><span class="n"><b>12</b> </span><span class="c"><!-- x --></span></div>',
+        HTML_PARSER,
+    )
+    for span in card.find_all("span"):
+        assert leaf_text(span) == span.get_text(strip=True)
+    assert leaf_text(card.select_one(".m")) == "Oct"